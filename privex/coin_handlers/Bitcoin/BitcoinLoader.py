@@ -139,7 +139,8 @@ class BitcoinLoader(BatchLoader, BitcoinMixin):
         if type(amt) == float:
             amt = '{0:.8f}'.format(amt)
 
-        log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, amt, txid)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, amt, txid)
 
         if category != 'receive': return None                                       # Ignore non-receive transactions
         if 'generated' in tx and tx['generated'] in [True, 'true', 1]: return None  # Ignore mining transactions
@@ -16,7 +16,8 @@
 
 """
 import logging
-from typing import List, Dict
+import sys
+from typing import List, Dict, Optional
 
 # from django.conf import settings
 from privex.jsonrpc import BitcoinRPC
@@ -27,6 +28,9 @@ from privex.helpers import empty
 
 log = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({True, 'true', 'True', 'TRUE', 1, 'yes'})
+"""Setting values which are considered ``True`` when casting boolean settings in :py:meth:`._clean_settings`"""
+
 
 class BitcoinMixin(BaseHandler):
     """
@@ -51,6 +55,17 @@ class BitcoinMixin(BaseHandler):
 
     _settings = {}  # type: Dict[str, dict]
 
+    _settings_sig = None  # type: Optional[tuple]
+    """Snapshot (see :py:meth:`._settings_snapshot`) of the coin / ``COIND_RPC`` settings ``_settings`` was made from"""
+
+    _settings_fields = ('setting_host', 'setting_port', 'setting_user', 'setting_pass', 'setting_json')
+
+    _rpc_cache = {}  # type: Dict[str, dict]
+    """Memoized :py:meth:`._rpc_settings` results, mapped by symbol. Reset whenever settings are re-loaded."""
+
+    _rpc_pool = {}  # type: Dict[str, BitcoinRPC]
+    """Pooled :class:`.BitcoinRPC` clients, mapped by symbol. Reset whenever settings are re-loaded."""
+
     # If a setting isn't specified, use these.
     _bc_defaults = dict(
         host='127.0.0.1', port=8332, user=None, password=None,
@@ -66,7 +81,8 @@ class BitcoinMixin(BaseHandler):
         :return dict coins: A dict<str,Coin> of supported coins, mapped by symbol
         """
         if hasattr(self, 'coins'):
-            return dict(self.coins)
+            # self.coins is normally already a dict, so avoid making a needless copy of it
+            return self.coins if isinstance(self.coins, dict) else dict(self.coins)
         elif hasattr(self, 'coin'):
             return {self.coin.symbol_id: self.coin}
         raise Exception('Cannot load settings as neither self.coin nor self.coins exists...')
@@ -79,9 +95,14 @@ class BitcoinMixin(BaseHandler):
         :param bool reset:  Default: False; if true - force refresh coin settings into self._settings
         :return dict _settings: {host:str, port:int, user:str, password:str, confirms_needed:int, use_trusted:bool}
         """
-        # If _settings isn't empty, and we aren't forcing a refresh, don't bother re-loading the coin settings
-        if len(self._settings) > 0 and not reset:
+        # If neither the coins' settings nor COIND_RPC have changed since _settings was generated, and we aren't
+        # forcing a refresh, don't bother re-loading the coin settings. In-place edits to either of them
+        # (e.g. ``COIND_RPC['BTC']['port'] = 8333``) are also picked up, as the values are compared too.
+        allset = self.allsettings
+        coind_rpc = allset.get('COIND_RPC') if isinstance(allset, dict) else None
+        if not reset and self._settings_unchanged(coind_rpc):
             return self._settings
+        sig = self._settings_snapshot(coind_rpc)
 
         s = {}   # Temporary settings dict
 
@@ -89,23 +110,69 @@ class BitcoinMixin(BaseHandler):
         # log.debug('Loading Bitcoind handler settings from Coin objects')
         for sym, c in self.all_coins.items():
             sc = c.settings     # {host,port,user,password,json}
-            s[sym] = {k: v for k, v in sc.items() if k != 'json'}    # Don't include the 'json' key
-            s[sym] = {**s[sym], **sc['json']}                        # Merge contents of 'json' into our settings
+            s[sym] = dict(sc)
+            s[sym].pop('json', None)                # Don't include the 'json' key
+            s[sym].update(sc.get('json') or {})     # Merge contents of 'json' into our settings
 
         # log.debug('Loading Bitcoind handler settings from settings.COIND_RPC (if it exists)')
         # If COIND_RPC has been set in settings.py, they take precedence over database-level settings.
-        settings = self.allsettings
-        if 'COIND_RPC' in settings:
-            for symbol, conn in settings['COIND_RPC'].items():
-                s[symbol] = dict(conn)
+        if coind_rpc:
+            for symbol, conn in coind_rpc.items():
+                s[sys.intern(symbol)] = dict(conn)
 
         # Finally, fill in any gaps with the default settings, and cast non-string settings to their correct type.
         self._clean_settings(s)
 
         # Store settings to the class attribute, and return them.
         self._settings = s
+        self._settings_sig = sig
+        # Any cached RPC kwargs were generated from the old settings, so they need to be thrown away.
+        self._rpc_cache = {}
+        self._rpc_pool = {}
         return self._settings
 
+    def _settings_snapshot(self, coind_rpc: Optional[dict]) -> tuple:
+        """
+        Returns a snapshot of the values which :py:meth:`._prep_settings` generates ``_settings`` from, for
+        :py:meth:`._settings_unchanged` to compare against later on.
+
+        :return tuple snapshot: ``(coind_rpc, rpc_copy, coins)`` - the ``COIND_RPC`` dict itself, a copy of its
+                                per-symbol dicts, and a dict mapping each symbol to its :class:`.Coin` object
+                                plus a tuple of that coin's ``setting_*`` values.
+        """
+        fields = self._settings_fields
+        rpc_copy = None if not coind_rpc else {sym: dict(conn) for sym, conn in coind_rpc.items()}
+        coins = {
+            sym: (c, tuple(getattr(c, f) for f in fields)) for sym, c in self.all_coins.items()
+        }
+        return coind_rpc, rpc_copy, coins
+
+    def _settings_unchanged(self, coind_rpc: Optional[dict]) -> bool:
+        """
+        Returns ``True`` if neither ``COIND_RPC`` nor the coins' settings have changed since the snapshot stored
+        in ``_settings_sig`` was taken.
+
+        Identities are compared first, followed by the values themselves, without building a new snapshot - a fresh
+        one is only generated by :py:meth:`._prep_settings` once something is found to have changed.
+        """
+        sig = self._settings_sig
+        if sig is None:
+            return False
+        old_rpc, rpc_copy, old_coins = sig
+        if coind_rpc is not old_rpc or (coind_rpc and coind_rpc != rpc_copy):
+            return False
+        all_coins = self.all_coins
+        if len(all_coins) != len(old_coins):
+            return False
+        for sym, c in all_coins.items():
+            old = old_coins.get(sym)
+            if old is None or old[0] is not c:
+                return False
+            for f, v in zip(self._settings_fields, old[1]):
+                if getattr(c, f) != v:
+                    return False
+        return True
+
     def _clean_settings(self, d_settings: Dict[str, dict]) -> Dict[str, dict]:
         """
         Clean up ``d_settings`` by setting any missing/empty settings to default values, and cast non-string settings
@@ -116,13 +183,13 @@ class BitcoinMixin(BaseHandler):
                                  passed dict will be altered in-place unless it's a copy.
         """
 
-        defs = self._bc_defaults
+        defs_items = tuple(self._bc_defaults.items())
         # Loop over each symbol and settings dict we were passed
         for sym, conn in d_settings.items():  # coin symbol : str, settings: dict
             # log.debug("Cleaning settings for symbol %s", sym)
             z = d_settings[sym]   # Pointer to the settings dict for this symbol
             # Loop over our default settings, compare to the user's settings
-            for def_key, def_val in defs.items():  # settings key : str, settings value : any
+            for def_key, def_val in defs_items:  # settings key : str, settings value : any
                 # Check if required setting key exists in user's settings
                 if def_key in z and not empty(z[def_key]):
                     continue
@@ -131,26 +198,29 @@ class BitcoinMixin(BaseHandler):
             # Cast settings keys to avoid casting errors
             z['confirms_needed'] = int(z['confirms_needed'])
             z['port'] = int(z['port'])
-            z['use_trusted'] = z['use_trusted'] in [True, 'true', 'True', 'TRUE', 1, 'yes']
-            z['string_amt'] = z['string_amt'] in [True, 'true', 'True', 'TRUE', 1, 'yes']
+            z['use_trusted'] = z['use_trusted'] in _TRUTHY
+            z['string_amt'] = z['string_amt'] in _TRUTHY
         return d_settings
 
     def _rpc_settings(self, symbol: str) -> dict:
         """Generate a dict that can be passed via BitcoinRPC's kwargs using the passed symbol's settings"""
-        s = self._prep_settings()[symbol]
-        rs = {k:v for k,v in s if k in ['port','password']}
-        rs += dict(username=s['user'], hostname=s['host'])
-        return rs
+        s = self._prep_settings()
+        if symbol not in self._rpc_cache:
+            conn = s[symbol]
+            self._rpc_cache[symbol] = {
+                'hostname': conn['host'], 'port': conn['port'],
+                'username': conn.get('user'), 'password': conn.get('password')
+            }
+        return self._rpc_cache[symbol]
 
     def _get_rpcs(self) -> Dict[str, BitcoinRPC]:
-        """Returns a dict mapping coin symbols to their RPC objects"""
-        rpcs = {}
-
-        for sym, conn in self._prep_settings().items():
-            rpcs[sym] = BitcoinRPC(
-                hostname=conn['host'],
-                port=conn['port'],
-                username=conn.get('user'),
-                password=conn.get('password')
-            )
-        return rpcs
+        """
+        Returns a dict mapping coin symbols to their RPC objects.
+
+        RPC objects are pooled in ``self._rpc_pool``, so the same client is returned for a symbol until the settings
+        are re-loaded (e.g. via ``_prep_settings(reset=True)``).
+        """
+        for sym in self._prep_settings().keys():
+            if sym not in self._rpc_pool:
+                self._rpc_pool[sym] = BitcoinRPC(**self._rpc_settings(sym))
+        return dict(self._rpc_pool)
@@ -113,13 +113,15 @@ def reload():
     global loaded
     loaded = True
 
-    # Grab a simple list of coin symbols with the type COIN_TYPE to populate the provides lists.
+    # Grab a set of coin symbols with the type COIN_TYPE to populate the provides sets (a frozenset for fast ``in``).
     # provides = Coin.objects.filter(coin_type=COIN_TYPE).values_list('symbol', flat=True)
-    provides = [coin.symbol for coin in handler_coins]
+    provides = frozenset(coin.symbol for coin in handler_coins)
     BitcoinLoader.provides = provides
     BitcoinManager.provides = provides
     # Since the handler is re-loading, we wipe the settings cache to ensure stale connection details aren't used.
     BitcoinMixin._settings = {}
+    BitcoinMixin._settings_sig = None
+    BitcoinMixin._rpc_pool = {}
 
 
 # Only run the initialisation code once.
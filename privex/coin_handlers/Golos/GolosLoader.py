@@ -1,9 +1,7 @@
+import datetime as _dt
+import sys
 from decimal import Decimal
-from typing import Generator, Optional, Dict, List
-
-import pytz
-from dateutil.parser import parse
-from golos import TransactionNotFound, Api
+from typing import Generator, Optional, Dict, List, TYPE_CHECKING
 
 from privex.coin_handlers.base.objects import Coin
 from privex.helpers import empty
@@ -11,10 +9,27 @@ from privex.helpers import empty
 from privex.coin_handlers import Deposit
 from privex.coin_handlers.base import BaseLoader
 from .GolosMixin import GolosMixin
+
+if TYPE_CHECKING:
+    from golos import Api
+
 import logging
 
 log = logging.getLogger(__name__)
 
+_UTC = _dt.timezone.utc
+
+
+def _parse_ts(ts: str) -> _dt.datetime:
+    """
+    Parse a Golos ``YYYY-MM-DDTHH:MM:SS`` timestamp into a UTC :class:`datetime.datetime`. Uses the C-implemented
+    ``fromisoformat`` where available (py3.7+), instead of the much slower general purpose dateutil parser.
+    """
+    ts = ts[:-1] if ts.endswith('Z') else ts
+    if hasattr(_dt.datetime, 'fromisoformat'):
+        return _dt.datetime.fromisoformat(ts).replace(tzinfo=_UTC)
+    return _dt.datetime.strptime(ts, '%Y-%m-%dT%H:%M:%S').replace(tzinfo=_UTC)
+
 
 class GolosLoader(BaseLoader, GolosMixin):
     def __init__(self, settings: Dict[str, dict] = None, coins: List[Coin] = None, *args, **kwargs):
@@ -27,22 +42,33 @@ class GolosLoader(BaseLoader, GolosMixin):
 
     def list_txs(self, batch=100) -> Generator[Deposit, None, None]:
         log.debug('Symbols: %s', self.symbols)
+        if len(self.symbols) == 0:
+            return
+        # Api instances (and their websocket) are shared between threads and serialised by a lock, so the history
+        # is simply fetched one symbol at a time.
         for s in self.symbols:
-            rpc = self.get_rpc(s)
-            our_account = self.coins[s].our_account
-            txs = rpc.get_account_history(our_account)
-            log.debug('Looping over %s txs', s)
-            for tx in txs:
-                try:
-                    cleaned = self._clean_tx(tx=tx, symbol=s, account=our_account)
-                
-                    if cleaned is None:
-                        continue
-                
-                    yield Deposit(**cleaned)
-                except Exception:
-                    log.exception('(skipping) Error processing Golos TX %s', tx)
+            s = sys.intern(s)
+            txs = self.get_rpc(s).get_account_history(self.coins[s].our_account)
+            yield from self._process_history(s, txs)
+
+    def _process_history(self, s: str, txs: list) -> Generator[Deposit, None, None]:
+        """Filter the account history ``txs`` for the symbol ``s``, and yield any incoming transfers as Deposit's"""
+        # Computed once per symbol, rather than by _clean_tx for every transaction
+        our_account, sym_u = self.coins[s].our_account, sys.intern(s.upper())
+        log.debug('Looping over %s txs', s)
+        for tx in txs:
+            # The vast majority of account history ops aren't transfers, so filter them out as cheaply as possible,
+            # before handing the remaining transfers to _clean_tx
+            if tx.get('type_op') != 'transfer' or tx.get('to') != our_account:
+                continue
+            try:
+                clean_tx = self._clean_tx(tx=tx, symbol=s, account=our_account, symbol_upper=sym_u)
+                if clean_tx is None:
                     continue
+                yield Deposit(**clean_tx)
+            except (KeyError, ValueError, ArithmeticError):
+                log.exception('(skipping) Error processing Golos TX %s', tx)
+                continue
 
     def load(self, tx_count=1000):
         # Unlike other coins, it's important to load a lot of TXs, because many won't actually be transfers
@@ -63,8 +89,15 @@ class GolosLoader(BaseLoader, GolosMixin):
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
 
-    def _clean_tx(self, tx: dict, symbol, account: str = None, memo: str = None) -> Optional[dict]:
-        """Filters an individual transaction dictionary"""
+    def _clean_tx(self, tx: dict, symbol, account: str = None, memo: str = None,
+                  symbol_upper: str = None) -> Optional[dict]:
+        """
+        Filters an individual transaction dictionary
+
+        :param str symbol_upper: ``symbol`` in uppercase - pass this if you're calling ``_clean_tx`` in a loop, so it
+                                 doesn't have to be re-computed for every transaction.
+        """
+        symbol_upper = symbol.upper() if symbol_upper is None else symbol_upper
         
         if tx.get('type_op') != 'transfer':
             return
@@ -78,12 +111,13 @@ class GolosLoader(BaseLoader, GolosMixin):
         if memo is not None and res['memo'] != memo.strip():
             return None
             
-        amt, sym = tx['amount'].split(' ')
-        if sym.upper() != symbol.upper():
-            log.debug(f'Skipping TX as symbol was {sym.upper()} (expected {symbol.upper()})')
+        amt, _, sym = tx['amount'].partition(' ')
+        if sym != symbol_upper and sym.upper() != symbol_upper:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('Skipping TX as symbol was %s (expected %s)', sym.upper(), symbol_upper)
             return
         res['amount'] = Decimal(amt)
-        res['tx_timestamp'] = pytz.utc.localize(parse(tx['timestamp']))
+        res['tx_timestamp'] = _parse_ts(tx['timestamp'])
         
         return res
         
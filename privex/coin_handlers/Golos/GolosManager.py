@@ -1,31 +1,59 @@
 from decimal import Decimal, ROUND_DOWN
-from typing import Union, Dict, List, Tuple
+from typing import Union, Dict, List, Tuple, TYPE_CHECKING
 
-from golos import Api
 from privex.coin_handlers.base.objects import Coin
 from privex.helpers import empty, dec_round
 
 from privex.coin_handlers.KeyStore import get_key_store
 from privex.coin_handlers.base import exceptions
 from privex.coin_handlers.base.BaseManager import BaseManager
+from privex.coin_handlers.base.decorators import ttl_cache
 from privex.coin_handlers.Golos.GolosMixin import GolosMixin
 
+if TYPE_CHECKING:
+    from golos import Api
+
 import logging
 
 log = logging.getLogger(__name__)
 
+_DEC_ZERO = Decimal(0)
+
 
 class GolosManager(BaseManager, GolosMixin):
+    _FMT_CACHE = {}  # type: Dict[int, str]
+    """Balance format strings (e.g. ``{0:,.3f}``) mapped by precision, generated by :py:meth:`._fmt_for`"""
+
     def __init__(self, settings: Dict[str, dict] = None, coin: Coin = None, *args, **kwargs):
         super().__init__(settings=settings, coin=coin, *args, **kwargs)
+        self._class_name = type(self).__name__
         self._rpc = None
         # List of Golos instances mapped by symbol
         self._rpcs = {}  # type: Dict[str, Api]
         self._precision = None
+        # These don't change during the manager's lifetime, so resolve them once rather than on every call.
+        self._our_account = self.coin.our_account
+
+    @classmethod
+    def _fmt_for(cls, prec: int) -> str:
+        """Returns a format string for displaying an amount with ``prec`` decimal places, e.g. ``{0:,.3f}``"""
+        if prec not in cls._FMT_CACHE:
+            cls._FMT_CACHE[prec] = '{0:,.' + str(prec) + 'f}'
+        return cls._FMT_CACHE[prec]
 
+    @ttl_cache(ttl=300, maxsize=4096, key=lambda self, address: (self.symbol, address), cache_if=bool)
     def address_valid(self, address) -> bool:
+        """
+        Returns ``True`` if the account ``address`` exists. Only existing accounts are cached (per symbol), as an
+        account which doesn't exist yet may be created at any time.
+        """
         return len(self.rpc.get_accounts([address])) > 0
 
+    @ttl_cache(ttl=3600, key=lambda self: self.symbol)
+    def _chain_version(self) -> str:
+        """The ``STEEMIT_BLOCKCHAIN_VERSION`` from the chain config. Cached, as it only changes during hardforks."""
+        return self.rpc.get_config()['STEEMIT_BLOCKCHAIN_VERSION']
+
     def health(self) -> Tuple[str, tuple, tuple]:
         """
         Return health data for the passed symbol.
@@ -38,24 +66,27 @@ class GolosManager(BaseManager, GolosMixin):
         headers = ('Symbol', 'Status', 'Coin Name', 'API Node', 'Head Block', 'Block Time', 'RPC Version',
                    'Our Account', 'Our Balance')
     
-        class_name = type(self).__name__
+        class_name = self._class_name
         api_node = asset_name = head_block = block_time = rpc_ver = our_account = balance = ''
     
         status = 'Okay'
         try:
             rpc = self.rpc
-            our_account = self.coin.our_account
-            if not self.address_valid(our_account):
+            our_account = self._our_account
+            # A single get_accounts call both checks our account exists, and contains it's balance
+            accs = rpc.get_accounts([our_account])
+            if len(accs) < 1:
                 status = 'Account {} not found'.format(our_account)
         
             asset_name = self.coin.display_name
-            balance = ('{0:,.' + str(self.precision) + 'f}').format(self.balance(our_account))
+            if len(accs) > 0:
+                balance = self._fmt_for(self.precision).format(Decimal(accs[0][self.symbol]))
             api_node = rpc.rpc.url
             props = rpc.get_dynamic_global_properties()
             head_block = str(props.get('head_block_number', ''))
             block_time = props.get('time', '')
-            rpc_ver = rpc.get_config()['STEEMIT_BLOCKCHAIN_VERSION']
-        except:
+            rpc_ver = self._chain_version()
+        except Exception:
             status = 'ERROR'
             log.exception('Exception during %s.health for symbol %s', class_name, self.symbol)
     
@@ -88,40 +119,37 @@ class GolosManager(BaseManager, GolosMixin):
         :return tuple: A tuple containing ('account', receiving_account). The memo must be generated
                        by the calling function.
         """
-        return 'account', self.coin.our_account
+        return 'account', self._our_account
 
     def balance(self, address: str = None, memo: str = None, memo_case: bool = False) -> Decimal:
         if not address:
-            address = self.coin.our_account
+            address = self._our_account
         
-        if not self.address_valid(address):
+        # get_accounts both validates the account and contains the balances, so we only need the one RPC call.
+        accs = self.rpc.get_accounts([address])
+        if len(accs) < 1:
             raise exceptions.AccountNotFound(f'Account "{address}" does not exist.')
         
-        acc = self.rpc.get_balances(address)[address]
-        return Decimal(acc[self.symbol.upper()])
+        return Decimal(accs[0][self.symbol])
     
     def send(self, amount: Decimal, address: str, from_address: str = None, memo: str = None,
              trigger_data: Union[dict, list] = None) -> dict:
         # Try from_address first. If that's empty, try using self.coin.our_account. If both are empty, abort.
         if empty(from_address):
-            if empty(self.coin.our_account):
+            if empty(self._our_account):
                 raise AttributeError("Both 'from_address' and 'coin.our_account' are empty. Cannot send.")
-            from_address = self.coin.our_account
-            
-        if not self.address_valid(address):
-            raise exceptions.AccountNotFound(f'Account "{address}" does not exist.')
-        if not self.address_valid(from_address):
-            raise exceptions.AccountNotFound(f'Account "{address}" does not exist.')
+            from_address = self._our_account
+        
+        bal = self._preflight_send(from_address, address)
         
         memo = "" if empty(memo) else memo
         prec = self.precision
-        sym = self.symbol.upper()
+        sym = self.symbol
         amount = dec_round(Decimal(amount), dp=prec, rounding=ROUND_DOWN)
         
-        if amount < Decimal(pow(10, -prec)):
+        if amount < self.min_amount:
             log.warning('Amount %s was passed, but is lower than precision for %s', amount, sym)
             raise ArithmeticError('Amount {} is lower than token {}s precision of {} DP'.format(amount, sym, prec))
-        bal = self.balance(from_address)
         if bal < amount:
             raise exceptions.NotEnoughBalance(
                 'Account {} has balance {} but needs {} to send this tx'.format(from_address, bal, amount)
@@ -139,11 +167,27 @@ class GolosManager(BaseManager, GolosMixin):
             'txid': t['id'],
             'coin': self.symbol,
             'amount': amount,
-            'fee': Decimal(0),
+            'fee': _DEC_ZERO,
             'from': from_address,
             'send_type': 'send'
         }
 
+    def _preflight_send(self, from_address: str, address: str) -> Decimal:
+        """
+        Validates both the sending and receiving account, and obtains the sender's balance, using a single
+        ``get_accounts`` RPC call.
+
+        :param str from_address: The account which coins are being sent from
+        :param str address:      The account which coins are being sent to
+        :raises AccountNotFound: When either ``from_address`` or ``address`` don't exist
+        :return Decimal balance: The balance of ``from_address`` for our symbol
+        """
+        accs = {a['name']: a for a in self.rpc.get_accounts([address, from_address])}
+        for acc in (address, from_address):
+            if acc not in accs:
+                raise exceptions.AccountNotFound(f'Account "{acc}" does not exist.')
+        return Decimal(accs[from_address][self.symbol])
+
     def get_priv(self, from_account: str, key_types: list = None):
         key_types = ['active'] if not key_types else key_types
         kstore = get_key_store()
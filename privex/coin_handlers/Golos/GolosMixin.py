@@ -1,18 +1,93 @@
+import functools
 import logging
+import threading
 from abc import ABC
-from typing import Dict, Optional
+from decimal import Decimal
+from typing import Dict, Optional, TYPE_CHECKING
 
-from golos import Api
 from privex.helpers import empty
 from privex.coin_handlers.base import SettingsMixin
 
+if TYPE_CHECKING:
+    from golos import Api
+
 log = logging.getLogger(__name__)
 
 
+def _golos_api():
+    """
+    Returns the :class:`golos.Api` class, importing the ``golos`` library on first use rather than when this module is
+    imported, so that it's only loaded once a Golos RPC instance is actually needed.
+    """
+    from golos import Api
+    return Api
+
+
+_MIN_AMOUNT = {p: Decimal(1).scaleb(-p) for p in range(20)}   # type: Dict[int, Decimal]
+"""Smallest sendable amount for each asset precision, i.e. ``{0: Decimal('1'), 3: Decimal('0.001'), ...}``"""
+
+class LockedApi:
+    """
+    Wraps a :class:`golos.Api`, so that only one thread at a time can make calls through it.
+
+    A ``golos.Api`` sends a request and then reads the response on the same websocket, without any locking - so two
+    threads sharing one could receive each other's responses. Every method call (and attribute lookup) made through
+    this wrapper holds the Api's lock for the duration of the call.
+    """
+    __slots__ = ('api', '_lock')
+
+    def __init__(self, api: 'Api'):
+        self.api = api
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        lock = self._lock
+        with lock:
+            val = getattr(self.api, name)
+        if not callable(val):
+            return val
+
+        @functools.wraps(val)
+        def _locked(*args, **kwargs):
+            with lock:
+                return val(*args, **kwargs)
+        return _locked
+
+
+_api_pool = {}   # type: Dict[Optional[tuple], LockedApi]
+"""Shared :class:`golos.Api` instances (wrapped in :class:`.LockedApi`) mapped by their tuple of nodes"""
+
+_api_pool_lock = threading.Lock()
+
+
+def shared_api(nodes=None) -> 'Api':
+    """
+    Returns a :class:`golos.Api` instance for the given ``nodes`` (or the default nodes if empty), which is shared between
+    every Golos loader / manager using the same nodes - so they re-use the same websocket connection rather than
+    each opening their own.
+
+    As the websocket is shared, the Api is wrapped in a :class:`.LockedApi`, so that calls from different threads
+    are made one at a time.
+
+    :param list nodes: A list of Golos RPC node URLs, or ``None`` to use the library's default nodes
+    :return LockedApi api: A shared (thread-safe) :class:`golos.Api` instance
+    """
+    key = None if empty(nodes, itr=True) else tuple([nodes] if isinstance(nodes, str) else nodes)
+    with _api_pool_lock:
+        if key not in _api_pool:
+            Api = _golos_api()
+            _api_pool[key] = LockedApi(Api() if key is None else Api(num_retries=10, nodes=list(key)))
+        return _api_pool[key]
+
+
 class GolosMixin(SettingsMixin, ABC):
-    _rpc: Api
-    _rpcs: Dict[str, Api]
+    _rpc: 'Api'
+    _rpcs: Dict[str, 'Api']
     _precision: int
+    _min_amount: Decimal
+
+    _precisions = {}  # type: Dict[tuple, int]
+    """Asset precisions shared across all instances, mapped by ``('golos', symbol)``"""
     
     def __init__(self, *args, **kwargs):
         self._rpc = None
@@ -20,22 +95,23 @@ class GolosMixin(SettingsMixin, ABC):
         # List of Golos instances mapped by symbol
         self._rpcs = {}  # type: Dict[str, Api]
         self._precision = None
+        self._min_amount = None
         
         super(GolosMixin, self).__init__(*args, **kwargs)
 
     @property
-    def rpc(self) -> Api:
+    def rpc(self) -> 'Api':
         if not self._rpc:
             # Use the symbol of the first coin for our settings.
             symbol = list(self.all_coins.keys())[0]
             settings = self.all_coins[symbol].settings['json']
             rpcs = settings.get('rpcs')
         
-            # If you've specified custom RPC nodes in the custom JSON, make a new instance with those
+            # If you've specified custom RPC nodes in the custom JSON, use a (shared) instance with those
             # Otherwise, use the default Golos API instance
             rpc_conf = dict(num_retries=10, nodes=rpcs)
             log.info('Getting Golos instance for coin %s - settings: %s', symbol, rpc_conf)
-            self._rpc = Api() if empty(rpcs, itr=True) else Api(**rpc_conf)  # type: Api
+            self._rpc = shared_api(rpcs)  # type: Api
             self._rpcs[symbol] = self._rpc
         return self._rpc
 
@@ -45,15 +121,27 @@ class GolosMixin(SettingsMixin, ABC):
             return None
         """Easy reference to the precision for our current symbol"""
         if not self._precision:
-            self._precision = int(self.rpc.asset_precision[self.symbol])
+            key = ('golos', self.symbol)
+            if key not in GolosMixin._precisions:
+                GolosMixin._precisions[key] = int(self.rpc.asset_precision[self.symbol])
+            self._precision = GolosMixin._precisions[key]
+            p = self._precision
+            self._min_amount = _MIN_AMOUNT[p] if p in _MIN_AMOUNT else Decimal(1).scaleb(-p)
         return self._precision
 
-    def get_rpc(self, symbol: str) -> Api:
+    @property
+    def min_amount(self) -> Optional[Decimal]:
+        """The smallest amount of our current symbol that can be sent, based on :py:attr:`.precision`"""
+        if self.precision is None:
+            return None
+        return self._min_amount
+
+    def get_rpc(self, symbol: str) -> 'Api':
         """
         Returns a Golos instance for querying data and sending TXs.
         
-        If a custom RPC list is specified in the Coin "custom json" settings, a new instance will be returned with the
-        RPCs specified in the json.
+        If a custom RPC list is specified in the Coin "custom json" settings, an instance using the RPCs specified in
+        the json will be returned (shared with any other loader / manager using the same RPCs).
         
         :param symbol: Coin symbol to get Beem RPC instance for
         :return beem.steem.Steem: An instance of :class:`beem.steem.Steem` for querying
@@ -63,6 +151,6 @@ class GolosMixin(SettingsMixin, ABC):
             rpcs = settings.get('rpcs')
             rpc_conf = dict(num_retries=10, nodes=rpcs)
             log.info('Getting Golos instance for coin %s - settings: %s', symbol, rpc_conf)
-            self._rpcs[symbol] = self.rpc if empty(rpcs, itr=True) else Api(**rpc_conf)
+            self._rpcs[symbol] = self.rpc if empty(rpcs, itr=True) else shared_api(rpcs)
         return self._rpcs[symbol]
 
@@ -35,10 +35,12 @@ passing an already instantiated class to ``set_key_store``.
 
 """
 import logging
+import sys
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import List, Optional, Type
+from typing import List, Optional, Type, Dict, Tuple
 
 from privex.helpers import is_true
 
@@ -57,6 +59,10 @@ class KeyPair:
     balance: Decimal
     used: bool
     
+    __slots__ = ('id', 'network', 'private_key', 'public_key', 'account', 'key_type', 'balance', 'used')
+    _FIELDS = __slots__
+    _FIELD_SET = frozenset(__slots__)
+    
     def __init__(self, network, private_key, public_key=None, account=None, key_type=None, **kwargs):
         self.network, self.private_key, self.public_key = network, private_key, public_key
         self.account, self.key_type = account, key_type
@@ -65,17 +71,14 @@ class KeyPair:
         self.id = kwargs.get('id')
 
     def __iter__(self):
-        for k in self.__class__.__dict__:
-            if k[:2] == '__':
-                continue
-            yield (k, getattr(self, k),)
+        return iter([(k, getattr(self, k),) for k in self._FIELDS])
 
     def __getitem__(self, key):
         """
-        When the instance is accessed like a dict, try returning the matching attribute.
-        If the attribute doesn't exist, or the key is an integer, try and pull it from raw_data
+        When the instance is accessed like a dict, try returning the matching field.
+        If the key isn't one of the KeyPair fields, raise a KeyError
         """
-        if hasattr(self, key):
+        if key in self._FIELD_SET:
             return getattr(self, key)
         raise KeyError(key)
 
@@ -95,10 +98,40 @@ class MemoryKeyStore(KeyStore):
     
     def __init__(self):
         self.store = []
+        # Indexes of the KeyPair's in self.store, to avoid scanning the entire store for common lookups.
+        # Each index holds KeyPair's in the same order as self.store, so the first match is the same as a full scan.
+        self._by_nak = defaultdict(list)      # type: Dict[Tuple[str, str, str], List[KeyPair]]
+        self._by_account = defaultdict(list)  # type: Dict[str, List[KeyPair]]
+        self._by_id = {}                      # type: Dict[int, KeyPair]
+    
+    def _index(self, s: KeyPair):
+        self._by_nak[(s.network, s.account, s.key_type)].append(s)
+        self._by_account[s.account].append(s)
+        if s.id is not None:
+            self._by_id[int(s.id)] = s
+    
+    def _reindex(self):
+        self._by_nak.clear()
+        self._by_account.clear()
+        self._by_id.clear()
+        for s in self.store:
+            self._index(s)
     
     def get(self, network=None, private_key=None, public_key=None, account=None, key_type=None, key_type__in=None,
             used=None, id=None, **kwargs) -> Optional[KeyPair]:
-        for i, s in enumerate(self.store):
+        # Narrow down the KeyPair's we need to check using the most specific index available
+        if id is not None:
+            candidates = [self._by_id[int(id)]] if int(id) in self._by_id else []
+        elif network is not None and account is not None and key_type is not None:
+            candidates = self._by_nak.get((network, account, key_type), [])
+        elif account is not None:
+            candidates = self._by_account.get(account, [])
+        else:
+            candidates = self.store
+        
+        # Convert any ``__in`` filters to a frozenset once, so each membership test in the loop below is O(1)
+        kt_in = None if key_type__in is None else frozenset(key_type__in)
+        for s in candidates:
             if network is not None and s.network != network:
                 continue
             if private_key is not None and s.private_key != private_key:
@@ -111,9 +144,7 @@ class MemoryKeyStore(KeyStore):
                 continue
             if used is not None and s.used is not used:
                 continue
-            if key_type__in is not None and s.key_type not in key_type__in:
-                continue
-            if id is not None and i != int(id):
+            if kt_in is not None and s.key_type not in kt_in:
                 continue
             return s
         return None
@@ -124,14 +155,25 @@ class MemoryKeyStore(KeyStore):
             for k, v in kwargs.items():
                 if hasattr(s, k):
                     setattr(s, k, v)
+            # The updated fields may be indexed, so the indexes need to be rebuilt
+            self._reindex()
             return s
         
         s = KeyPair(**kwargs, id=len(self.store) + 1)
         self.store.append(s)
+        self._index(s)
         return s
 
 
-try:
+def _django_key_store() -> type:
+    """
+    Internal function. Defines and returns the :class:`.DjangoKeyStore` class.
+
+    Django is only imported when ``DjangoKeyStore`` is first accessed (see :py:func:`.__getattr__`), as most users
+    of this package won't be using Django.
+
+    :raises ImportError: When Django (or :py:mod:`privex.helpers.django`) can't be imported
+    """
     from django.db import models
     from privex.helpers.django import model_to_dict
     
@@ -142,13 +184,50 @@ try:
             self.model = model
         
         def get(self, **kwargs) -> Optional[KeyPair]:
-            obj = self.model.objects.filter(**kwargs)
-            if len(obj) < 1:
+            """
+            Returns the first key pair row matching the Django lookups ``kwargs`` (e.g. ``key_type__in=[...]``)
+            as a :class:`.KeyPair`, or ``None`` if no row matches.
+
+            Only a single ``LIMIT 1`` query is made. As lookups are almost always by network + account + key type,
+            your model should have an index covering them, e.g.::
+
+                class Meta:
+                    indexes = [models.Index(fields=['network', 'account', 'key_type'])]
+
+            """
+            obj = self.model.objects.filter(**kwargs).first()
+            if obj is None:
                 return None
-            return KeyPair(**model_to_dict(obj[0]))
+            return KeyPair(**model_to_dict(obj))
+
+    # Defined within this function, but it's exposed as privex.coin_handlers.KeyStore.DjangoKeyStore
+    DjangoKeyStore.__qualname__ = 'DjangoKeyStore'
+    return DjangoKeyStore
+
+
+_django_missing = False
+"""Set to ``True`` once importing Django for :class:`.DjangoKeyStore` has failed, so it isn't re-attempted"""
+
+
+def __getattr__(name: str):
+    """Lazily create :class:`.DjangoKeyStore` upon first access (PEP 562), if Django is available"""
+    global _django_missing
+    if name == 'DjangoKeyStore' and not _django_missing:
+        try:
+            cls = globals()[name] = _django_key_store()
+            return cls
+        except ImportError as e:
+            _django_missing = True
+            log.debug('privex.coin_handlers.KeyStore failed to initialise DjangoKeyStore: %s', str(e))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-except ImportError as e:
-    log.debug('privex.coin_handlers.KeyStore failed to initialise DjangoKeyStore: %s', str(e))
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported on Python 3.7+, so DjangoKeyStore has to be created immediately.
+    try:
+        DjangoKeyStore = _django_key_store()
+    except ImportError as e:
+        log.debug('privex.coin_handlers.KeyStore failed to initialise DjangoKeyStore: %s', str(e))
         
 
 def get_key_store() -> KeyStore:
@@ -1,15 +1,17 @@
-from datetime import datetime
-from decimal import Decimal
-from typing import Generator, List, Dict
-
-import pytz
-from privex.helpers import empty, sleep
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Generator, List, Dict, Tuple, AsyncIterator
+
+from privex.helpers import empty
 from privex.jsonrpc.objects import MoneroTransfer
 
 from privex.coin_handlers.base.objects import Deposit, Coin
 from privex.jsonrpc import MoneroRPC
 
-from privex.coin_handlers.Monero.MoneroMixin import MoneroMixin
+from privex.coin_handlers.Monero.MoneroMixin import MoneroMixin, running_loop
 from privex.coin_handlers.base.BaseLoader import BaseLoader
 
 import logging
@@ -18,6 +20,10 @@ log = logging.getLogger(__name__)
 
 
 class MoneroLoader(BaseLoader, MoneroMixin):
+    max_workers = 8
+    """Maximum number of threads used by :py:meth:`.list_txs` to load transfers concurrently"""
+    max_tx_errors_logged = 10
+    """Maximum number of invalid TXs which are logged individually per symbol during :py:meth:`.list_txs`"""
 
     def __init__(self, settings: Dict[str, dict] = None, coins: List[Coin] = None, *args, **kwargs):
         super(MoneroLoader, self).__init__(settings=settings, coins=coins, *args, **kwargs)
@@ -26,53 +32,132 @@ class MoneroLoader(BaseLoader, MoneroMixin):
         # Get all RPC objects
         self.rpcs = self._get_rpcs()
         self.wallet_opened = False
+        # A wallet RPC can only have one wallet open at a time, so each RPC endpoint (host, port) gets a lock which is
+        # held while a wallet is open on it.
+        self._wallet_locks = {}  # type: Dict[Tuple[str, int], threading.Lock]
+        self._wallet_locks_lock = threading.Lock()
+
+    def _wallet_lock(self, symbol: str) -> threading.Lock:
+        """Returns the lock for the wallet RPC endpoint used by ``symbol``"""
+        rpc = self.rpcs[symbol]
+        key = (rpc.hostname, rpc.port)
+        with self._wallet_locks_lock:
+            if key not in self._wallet_locks:
+                self._wallet_locks[key] = threading.Lock()
+            return self._wallet_locks[key]
+
+    def _fetch_transfers(self, symbol: str) -> Tuple[str, list]:
+        """Opens the wallet for ``symbol`` and returns a tuple of ``(symbol, incoming_transfers)``"""
+        with self._wallet_lock(symbol):
+            log.debug('Looking up account ID for symbol %s', symbol)
+            acc_id = self.account_id(symbol=symbol)
+            log.debug('Entering wallet for %s', symbol)
+            with self.wallet(symbol) as w:  # type: MoneroRPC
+                log.debug('Loading transfers for account ID %s', acc_id)
+                # We only process incoming transfers, so there's no need to have the RPC return (and us parse)
+                # every outgoing transfer too.
+                kw = {}
+                min_height = self.settings[symbol].get('min_height')
+                if not empty(min_height):
+                    # Don't load (or parse) the entire history of the wallet if a starting block height was set
+                    kw = dict(filter_by_height=True, min_height=int(min_height))
+                txs = w.get_transfers(account_index=acc_id, incoming=True, outgoing=False, **kw)
+        return symbol, txs.get('in', [])
 
     def list_txs(self, batch=100) -> Generator[Deposit, None, None]:
         log.debug('Symbols: %s', self.symbols)
-        for s in self.symbols:
-            log.debug('Entering wallet for %s', s)
-            with self.wallet(s) as w:  # type: MoneroRPC
-                log.debug('Looking up account ID for symbol %s', s)
-                acc_id = self.account_id(symbol=s)
-                log.debug('Loading transfers for account ID %s', acc_id)
-                txs = w.get_transfers(account_index=acc_id)
-            log.debug('Looping over "in" txs')
-            for tx in txs.get('in', []):
-                try:
-                    cleaned = self._clean_tx(tx=tx, symbol=s)
-
-                    if cleaned is None:
-                        continue
-
-                    yield Deposit(**cleaned)
-                except Exception:
-                    log.exception('(skipping) Error processing Monero TX %s', tx)
+        if len(self.symbols) == 0:
+            return
+        # Load the transfers for each symbol concurrently, and process each symbol's TXs as soon as they're loaded.
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.symbols))) as ex:
+            futures = [ex.submit(self._fetch_transfers, s) for s in self.symbols]
+            for fut in as_completed(futures):
+                yield from self._process_transfers(*fut.result())
+
+    async def list_txs_async(self, batch=100) -> AsyncIterator[Deposit]:
+        """
+        Async version of :py:meth:`.list_txs` for use within an asyncio event loop. Transfers for each symbol are
+        loaded in a thread pool (so the event loop isn't blocked by the RPC calls), and each symbol's deposits are
+        yielded as soon as that symbol's transfers have loaded.
+
+        Usage:
+
+            >>> async for deposit in MoneroLoader(coins=coins).list_txs_async():
+            ...     print(deposit.txid, deposit.amount)
+
+        """
+        log.debug('Symbols: %s', self.symbols)
+        if len(self.symbols) == 0:
+            return
+        loop = running_loop()
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.symbols))) as ex:
+            futures = [loop.run_in_executor(ex, self._fetch_transfers, s) for s in self.symbols]
+            for fut in asyncio.as_completed(futures):
+                s, txs = await fut
+                for d in self._process_transfers(s, txs):
+                    yield d
+
+    def _process_transfers(self, symbol: str, txs: List[MoneroTransfer]) -> Generator[Deposit, None, None]:
+        """Cleans the incoming transfers ``txs`` loaded for ``symbol``, yielding a :class:`.Deposit` for each valid TX"""
+        need_confs = self.settings[symbol].get('confirms_needed', 1)
+        log.debug('Looping over "in" txs for %s', symbol)
+        errors = 0
+        for tx in txs:
+            try:
+                cleaned = self._clean_tx(tx=tx, symbol=symbol, need_confs=need_confs)
+
+                if cleaned is None:
                     continue
 
-    def _clean_tx(self, tx: MoneroTransfer, symbol, address=None) -> dict:
-        """Filters an individual transaction. See :meth:`.clean_txs` for info"""
+                yield Deposit(**cleaned)
+            except (KeyError, ValueError, TypeError, AttributeError, InvalidOperation) as e:
+                # Malformed TXs tend to arrive in bursts, so only log the first few (without an expensive traceback)
+                errors += 1
+                if errors <= self.max_tx_errors_logged:
+                    log.warning('(skipping) Error processing %s TX %s: %s %s',
+                                symbol, getattr(tx, 'txid', tx), type(e).__name__, str(e))
+                continue
+        if errors > self.max_tx_errors_logged:
+            log.warning('(skipped) %d more %s TXs could not be processed', errors - self.max_tx_errors_logged, symbol)
+
+    @staticmethod
+    def _has_confs(tx: MoneroTransfer, need_confs: int) -> bool:
+        """
+        Returns True if ``tx`` has at least ``need_confs`` confirmations, or at least as many as the wallet
+        suggests for it (``suggested_confirmations_threshold``)
+        """
+        confs = int(tx.confirmations)
+        return confs >= need_confs or confs >= int(tx.suggested_confirmations_threshold)
 
-        need_confs = self.settings[symbol].get('confirms_needed', 1)
+    def _clean_tx(self, tx: MoneroTransfer, symbol, address=None, need_confs: int = None) -> dict:
+        """
+        Filters an individual transaction. See :meth:`.clean_txs` for info
+
+        :param int need_confs: The ``confirms_needed`` setting for ``symbol`` - pass this if you're calling
+                               ``_clean_tx`` in a loop, so it doesn't have to be looked up for every transaction.
+        """
+        if need_confs is None:
+            need_confs = self.settings[symbol].get('confirms_needed', 1)
 
         txid = tx.txid
         category = tx.type
-        amt = tx.decimal_amount
 
-        log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, amt, txid)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Filtering/cleaning transaction, Cat: %s, Amt: %s, TXID: %s', category, tx.decimal_amount, txid)
 
+        # Do the cheap filtering first, so we don't bother converting the amount / timestamp of TXs we're skipping
         if category != 'in': return None  # Ignore non-receive transactions
         # if 'generated' in tx and tx['generated'] in [True, 'true', 1]: return None  # Ignore mining transactions
         # Filter by receiving address if needed
         if not empty(address) and tx.address != address: return None
         # If a TX has less confirmations than needed, check if we can trust unconfirmed TXs.
         # If not, we can't accept this TX.
-        confs = int(tx.confirmations)
-        if confs < need_confs:
-            if confs < int(tx.suggested_confirmations_threshold):
-                log.debug('Got %s transaction %s, but only has %d confs, needs %d', symbol, txid, confs, need_confs)
-                return None
-        d = datetime.utcfromtimestamp(tx.timestamp)
-        d = pytz.utc.localize(d)
+        if not self._has_confs(tx, need_confs):
+            log.debug('Got %s transaction %s, but only has %s confs, needs %d', symbol, txid, tx.confirmations,
+                      need_confs)
+            return None
+        amt = tx.decimal_amount
+        d = datetime.fromtimestamp(tx.timestamp, tz=timezone.utc)
 
         return dict(
             txid=txid,
@@ -87,28 +172,7 @@ class MoneroLoader(BaseLoader, MoneroMixin):
         pass
 
     def __enter__(self):
-        log.debug('%s entering with statement', self.__class__.__name__)
-
-        if self.wallet_opened:
-            log.debug('Wallet already open')
-            return self
-        s = self.xmr_settings
-        if empty(s['wallet']):
-            log.debug('%s entered. No wallet specified for %s. Not opening any wallet.', self.__class__.__name__)
-            return self
-
-        sleep(3)
-        log.debug('Opening wallet %s', s['wallet'])
-        self.rpcs['XMR'].open_wallet(filename=s['wallet'], password=s['walletpass'])
-        log.debug('Wallet opened')
-        self.wallet_opened = True
-        return self
+        return self._open_wallet_ctx()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        s = self.xmr_settings
-        if empty(s['wallet']):
-            log.debug('%s exiting. No wallet specified. Not closing any wallet.', self.__class__.__name__)
-            return self
-        log.debug('%s exiting. Calling store()', self.__class__.__name__)
-        self.rpcs['XMR'].store()
-        self.wallet_opened = False
+        self._close_wallet_ctx()
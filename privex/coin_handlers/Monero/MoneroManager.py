@@ -1,22 +1,36 @@
+import functools
 from decimal import Decimal
-from time import sleep
-from typing import Union, Dict, List
+from time import monotonic
+from typing import Union, Dict, List, Tuple
 
-from privex.helpers import empty, is_true
-from privex.jsonrpc import MoneroRPC, RPCException
-from privex.jsonrpc.core import atomic_to_decimal
+from privex.helpers import is_true
+from privex.jsonrpc import RPCException
 
 from privex.coin_handlers.base.objects import Coin
-from privex.coin_handlers.base.exceptions import AccountNotFound, NotEnoughBalance, CoinHandlerException, DeadAPIError
+from privex.coin_handlers.base.exceptions import AccountNotFound, NotEnoughBalance
 from privex.coin_handlers.base.BaseManager import BaseManager
-from privex.coin_handlers.Monero.MoneroMixin import MoneroMixin
+from privex.coin_handlers.base.decorators import ttl_cache
+from privex.coin_handlers.Monero.MoneroMixin import MoneroMixin, running_loop
 
 import logging
 
 log = logging.getLogger(__name__)
 
+_ATOMIC_UNIT = Decimal(10 ** 12)
+"""Number of atomic units (piconero) per XMR"""
+
+
+def _atomic_to_decimal(amount: int) -> Decimal:
+    """
+    Same as :func:`privex.jsonrpc.core.atomic_to_decimal`, but divides by the pre-built :py:attr:`._ATOMIC_UNIT`
+    instead of constructing the divisor on every call.
+    """
+    return Decimal(amount) / _ATOMIC_UNIT
+
 
 class MoneroManager(BaseManager, MoneroMixin):
+    balance_ttl = 2.0
+    """Number of seconds that :py:meth:`.balance` results are cached for"""
 
     def __init__(self, settings: Dict[str, dict] = None, coin: Coin = None, *args, **kwargs):
         super(MoneroManager, self).__init__(settings=settings, coin=coin, *args, **kwargs)
@@ -24,10 +38,19 @@ class MoneroManager(BaseManager, MoneroMixin):
         self.rpcs = self._get_rpcs()
         self.rpc = self.rpcs[self.symbol]
         self.wallet_opened = False
+        # Recently loaded balances mapped by (symbol, address), plus the monotonic time they were loaded.
+        self._bal_cache = {}  # type: Dict[Tuple[str, str], Tuple[float, Decimal]]
+
+    @ttl_cache(ttl=3600, maxsize=50000, key=lambda self, address: (self.symbol, address))
+    def _validate_address(self, address: str) -> dict:
+        """
+        Returns the ``validate_address`` RPC result for ``address``. As an address's validity never changes, results
+        are cached for an hour per ``(symbol, address)``, and shared between all :class:`.MoneroManager` instances.
+        """
+        return self.rpc_any(self.symbol).validate_address(address=address)
 
     def address_valid(self, address) -> bool:
-        validate = self.rpc.validate_address(address=address)
-        return is_true(validate['valid'])
+        return is_true(self._validate_address(address)['valid'])
 
     def get_deposit(self) -> tuple:
         """
@@ -35,24 +58,79 @@ class MoneroManager(BaseManager, MoneroMixin):
         :return tuple: A tuple containing ('address', crypto_address)
         """
         account_id = self.account_id(symbol=self.symbol)
-
+        self._ensure_wallet_open()
         return 'address', self.rpc.create_address(account_index=account_id)['address']
 
-    def balance(self, address: str = None, memo: str = None, memo_case: bool = False) -> Decimal:
-        total_bal = Decimal('0')
+    def balance(self, address: str = None, memo: str = None, memo_case: bool = False,
+                max_age: float = None) -> Decimal:
+        """
+        Get the balance of our account, or of one of it's sub-addresses if ``address`` is specified.
+
+        Balances are cached for :py:attr:`.balance_ttl` seconds, so that repeated calls (e.g. polling) don't each
+        need a ``get_balance`` RPC call.
 
-        with self.wallet(self.symbol) as w:  # type: MoneroRPC
+        :param str address: (Optional) A sub-address belonging to our account
+        :param float max_age: (Optional) Only use a cached balance if it's at most this many seconds old. Pass ``0``
+                              to always load a fresh balance (e.g. before sending).
+        :return Decimal balance: The balance of our account / ``address``
+        """
+        max_age = self.balance_ttl if max_age is None else max_age
+        key = (self.symbol, '*' if address is None else address)
+        cached = self._bal_cache.get(key)
+        if cached is not None and monotonic() - cached[0] <= max_age:
+            return cached[1]
+
+        if address is not None:
+            bal = self.bulk_balance([address])[address]
+        else:
             account_id = self.account_id(symbol=self.symbol)
+            with self.wallet(self.symbol) as w:
+                bal = _atomic_to_decimal(w.get_balance(account_index=account_id)['balance'])
+
+        if len(self._bal_cache) >= 1024:
+            self._bal_cache.clear()
+        self._bal_cache[key] = (monotonic(), bal)
+        return bal
+
+    def balances_by_address(self) -> Dict[str, Decimal]:
+        """
+        Get the balance of every sub-address of our account, using a single ``get_balance`` call.
+
+        :return dict balances: A dict of ``address: Decimal balance``
+        """
+        account_id = self.account_id(symbol=self.symbol)
+        with self.wallet(self.symbol) as w:
             bal = w.get_balance(account_index=account_id)
-            # log.debug('Balance data: %s', bal)
-            if address is None:
-                return atomic_to_decimal(bal['balance'])
 
-            for a in bal['per_subaddress']:
-                log.debug('Sub-address: %s', a)
-                if a['address'] == address:
-                    total_bal += atomic_to_decimal(a['balance'])
-        return total_bal
+        balances = {}
+        for a in bal.get('per_subaddress', []):
+            addr = a['address']
+            balances[addr] = balances.get(addr, Decimal('0')) + _atomic_to_decimal(a['balance'])
+        log.debug('Loaded balances for %d sub-addresses of account %s', len(balances), account_id)
+        return balances
+
+    def bulk_balance(self, addresses: List[str]) -> Dict[str, Decimal]:
+        """
+        Get the balance of multiple sub-addresses of our account, using a single ``get_balance`` call.
+
+            >>> MoneroManager(coin=coin).bulk_balance(['8xxxxxx', '8yyyyyy'])
+            {'8xxxxxx': Decimal('1.5'), '8yyyyyy': Decimal('0')}
+
+        :param list addresses: A list of sub-addresses belonging to our account
+        :return dict balances: A dict of ``address: Decimal balance``. Unknown addresses have a balance of 0.
+        """
+        balances = self.balances_by_address()
+        return {a: balances.get(a, Decimal('0')) for a in addresses}
+
+    async def balance_async(self, address: str = None, memo: str = None, memo_case: bool = False) -> Decimal:
+        """Async version of :py:meth:`.balance` - runs it in the event loop's default executor"""
+        loop = running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.balance, address, memo, memo_case))
+
+    async def bulk_balance_async(self, addresses: List[str]) -> Dict[str, Decimal]:
+        """Async version of :py:meth:`.bulk_balance` - runs it in the event loop's default executor"""
+        loop = running_loop()
+        return await loop.run_in_executor(None, self.bulk_balance, addresses)
 
     def send(self, amount: Decimal, address: str, from_address: int = 0, memo: str = None,
              trigger_data: Union[dict, list] = None) -> dict:
@@ -87,27 +165,47 @@ class MoneroManager(BaseManager, MoneroMixin):
               send_type:str       - Should be statically set to "send"
           }
 
+        """
+        return self.send_many([dict(amount=amount, address=address)], from_address=from_address)
+
+    def send_many(self, transfers: List[dict], from_address: int = 0) -> dict:
+        """
+        Send XMR to multiple addresses using a single multi-destination Monero transaction, e.g. for batched
+        withdrawals. All destination addresses are validated before anything is sent.
+
+            >>> s = MoneroManager()
+            >>> s.send_many([dict(amount=Decimal('0.1'), address='4xxxxxxxxx'), dict(amount='2', address='8xxxxxxxx')])
+
+        :param list transfers:      A list of dict's containing ``amount`` (Decimal / str) and ``address`` (str)
+        :param from_address:        The monero account index to use as an integer
+        :raises AccountNotFound:    One of the destination addresses isn't valid
+        :raises NotEnoughBalance:   The wallet does not have enough balance to send the total amount.
+        :return dict: Result Information - same format as :py:meth:`.send`, with ``amount`` being the total sent
         """
         from_address = 0 if from_address is None else int(from_address)
-        v = self.rpc.validate_address(address)
-        if not v['valid']:
-            raise AccountNotFound(f"Invalid Monero address '{address}'")
+        addresses = ', '.join(t['address'] for t in transfers)
+        for t in transfers:
+            if not self.address_valid(t['address']):
+                raise AccountNotFound(f"Invalid Monero address '{t['address']}'")
+        amount = sum(Decimal(t['amount']) for t in transfers)
+        dests = [dict(amount=self.rpc.decimal_to_atomic(t['amount']), address=t['address']) for t in transfers]
+        self._ensure_wallet_open()
         try:
-            snd = self.rpc.simple_transfer(
-                amount=amount, address=address, account_index=from_address
-            )
+            snd = self.rpc.transfer(destinations=dests, account_index=from_address)
         except RPCException as e:
             errs = str(e)
             if 'WALLET_RPC_ERROR_CODE_WRONG_ADDRESS' in errs.upper():
-                raise AccountNotFound(f"Invalid Monero address '{address}'")
+                raise AccountNotFound(f"Invalid Monero address '{addresses}'")
             if 'not enough money' in errs.lower():
-                raise NotEnoughBalance(f"Failed to send {amount} XMR to {address} - not enough balance!")
+                raise NotEnoughBalance(f"Failed to send {amount} XMR to {addresses} - not enough balance!")
             raise e
+        # Our balance has changed, so any cached balances are now wrong
+        self._bal_cache.clear()
 
         res = dict(
             txid=snd['tx_hash'],
-            amount=self.rpc.atomic_to_decimal(snd['amount']),
-            fee=self.rpc.atomic_to_decimal(snd['fee']),
+            amount=_atomic_to_decimal(snd['amount']),
+            fee=_atomic_to_decimal(snd['fee']),
             tx_key=snd.get('tx_key', None),
             tx_blob=snd.get('tx_blob', None),
             tx_metadata=snd.get('tx_metadata', None),
@@ -118,28 +216,7 @@ class MoneroManager(BaseManager, MoneroMixin):
         return res
 
     def __enter__(self):
-        log.debug('%s entering with statement', self.__class__.__name__)
-
-        if self.wallet_opened:
-            log.debug('Wallet already open')
-            return self
-        s = self.xmr_settings
-        if empty(s['wallet']):
-            log.debug('%s entered. No wallet specified for %s. Not opening any wallet.', self.__class__.__name__)
-            return self
-
-        sleep(3)
-        log.debug('Opening wallet %s', s['wallet'])
-        self.rpcs['XMR'].open_wallet(filename=s['wallet'], password=s['walletpass'])
-        log.debug('Wallet opened')
-        self.wallet_opened = True
-        return self
+        return self._open_wallet_ctx()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        s = self.xmr_settings
-        if empty(s['wallet']):
-            log.debug('%s exiting. No wallet specified. Not closing any wallet.', self.__class__.__name__)
-            return self
-        log.debug('%s exiting. Calling store()', self.__class__.__name__)
-        self.rpcs['XMR'].store()
-        self.wallet_opened = False
+        self._close_wallet_ctx()
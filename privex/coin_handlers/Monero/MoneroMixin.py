@@ -1,7 +1,17 @@
+import asyncio
+import itertools
 import logging
+import threading
 from abc import ABC
-from typing import Dict, Any, Union, List
+from time import monotonic
+from typing import Dict, Any, Union, List, Tuple, Iterator
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPDigestAuth
+from urllib3.util.retry import Retry
+
+from privex.coin_handlers.base.decorators import retry_on_err, CircuitBreaker
 from privex.coin_handlers.base.exceptions import AccountNotFound
 from privex.helpers import empty, sleep
 from privex.jsonrpc import MoneroRPC
@@ -9,6 +19,115 @@ from privex.coin_handlers.base.SettingsMixin import SettingsMixin
 
 log = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    log.debug('orjson is not installed. Monero RPC calls will use the standard json module.')
+
+
+def _make_session(retries: int = 0) -> requests.Session:
+    """
+    Create a :class:`requests.Session` with a larger keep-alive connection pool.
+
+    By default, the session's adapter doesn't retry anything - read-only RPC calls are retried (with backoff) by
+    :class:`.RetryMoneroRPC` instead, and wallet RPC calls such as ``transfer`` aren't safe to repeat. Pass ``retries``
+    to have failed *connections* (where the request never reached the server) retried by the adapter itself.
+
+    :param int retries: Number of times the adapter should retry a failed connection (Default: ``0``)
+    """
+    sess = requests.Session()
+    max_retries = Retry(total=retries, connect=retries, read=0, backoff_factor=0.3) if retries > 0 else 0
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=max_retries)
+    sess.mount('http://', adapter)
+    sess.mount('https://', adapter)
+    return sess
+
+
+SESSION = _make_session()
+"""Shared HTTP session used by all Monero RPC objects, so connections are kept alive between managers / loaders"""
+
+PROBE_SESSION = _make_session()
+"""
+Separate (non-retrying) HTTP session used by :py:meth:`.MoneroMixin._wait_for_rpc`, so that readiness probes don't
+wait on, or tie up, connections from the main :py:attr:`.SESSION` pool
+"""
+
+BREAKER = CircuitBreaker(threshold=5, cooldown=30)
+"""Circuit breaker shared by all Monero RPC objects, keyed by ``(hostname, port)``"""
+
+_NET_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+SAFE_METHODS = frozenset({
+    'get_accounts', 'get_address', 'get_balance', 'get_height', 'get_transfers', 'get_version', 'validate_address',
+})
+"""Read-only wallet RPC methods which are safe to automatically retry"""
+
+
+def running_loop() -> asyncio.AbstractEventLoop:
+    """
+    Returns the event loop of the coroutine which calls this. Uses :func:`asyncio.get_running_loop` where it's
+    available, falling back to :func:`asyncio.get_event_loop` on Python 3.6.
+    """
+    if hasattr(asyncio, 'get_running_loop'):
+        return asyncio.get_running_loop()
+    return asyncio.get_event_loop()
+
+
+class RetryMoneroRPC(MoneroRPC):
+    """
+    A :class:`.MoneroRPC` which retries read-only calls (:py:attr:`.SAFE_METHODS`) with exponential backoff after
+    network errors, and refuses to call nodes which the :py:attr:`.BREAKER` considers dead.
+
+    Other calls (e.g. ``transfer``) are never retried automatically, as they aren't safe to repeat.
+    """
+    def call(self, method, *params, **dicdata):
+        key = (self.hostname, self.port)
+        BREAKER.check(key)
+        try:
+            if method in SAFE_METHODS:
+                res = self._retry_call(method, *params, **dicdata)
+            else:
+                res = super().call(method, *params, **dicdata)
+        except _NET_ERRORS:
+            BREAKER.failure(key)
+            raise
+        BREAKER.success(key)
+        return res
+
+    @retry_on_err(max_retries=4, delay=0.3, backoff=2, jitter=0.1, retry_on=_NET_ERRORS)
+    def _retry_call(self, method, *params, **dicdata):
+        return super().call(method, *params, **dicdata)
+
+    def _call(self, method: str, params: Union[dict, list] = None, jid: int = None, del_params=False,
+              raise_status=True) -> Union[dict, list]:
+        """
+        Same as :py:meth:`privex.jsonrpc.JsonRPC._call`, but encodes the request / decodes the response with
+        ``orjson`` if it's installed, which is much faster at parsing large responses (e.g. ``get_transfers``).
+        """
+        params = [] if params is None else params
+        if orjson is None:
+            return super()._call(method, params=params, jid=jid, del_params=del_params, raise_status=raise_status)
+
+        payload = {"method": method, "params": params, "jsonrpc": "2.0", "id": self.next_id if jid is None else jid}
+        if del_params:
+            del payload['params']
+
+        req_args = dict(data=orjson.dumps(payload, default=str), headers=self.headers, timeout=self.timeout)
+        if self.auth == 'digest' and self.username is not None:
+            req_args['auth'] = HTTPDigestAuth(self.username, self.password)
+        r = self.req.post(self.url, **req_args)
+        try:
+            if raise_status:
+                r.raise_for_status()
+            return orjson.loads(r.content)
+        except requests.HTTPError as e:
+            log.warning("Error while querying RPC server %s - Response: %s", self.url, e.response.text)
+            raise e
+        except orjson.JSONDecodeError as e:
+            log.warning('JSONDecodeError while querying %s - Raw response data was: %s', self.url, r.text)
+            raise e
+
 
 class RPCWrapper:
     rpc: MoneroRPC
@@ -17,16 +136,59 @@ class RPCWrapper:
         self.rpc = rpc
 
     def __getattr__(self, name):
-        def c(*args, **kwargs):
-            return getattr(self.rpc, name)(*args, **kwargs)
+        """
+        Pass any unknown attributes through to our MoneroRPC.
 
-        return c
+        Methods are cached on the instance after the first lookup, so later calls don't go through ``__getattr__``.
+
+        :param name: Name of the attribute requested
+        :return: The attribute (usually a bound method) from :py:attr:`.rpc`
+        """
+        if name == 'rpc':
+            # Avoid infinite recursion if 'rpc' hasn't been set yet
+            raise AttributeError(name)
+        attr = getattr(self.rpc, name)
+        if callable(attr):
+            object.__setattr__(self, name, attr)
+        return attr
 
     def __enter__(self): return self
 
     def __exit__(self, exc_type, exc_val, exc_tb): pass
 
 
+class _RPCMethod:
+    """
+    Non-data descriptor which passes through a :class:`.MoneroRPC` method on :class:`.RPCWrapper`.
+
+    Upon first access from an instance, the bound method from it's ``rpc`` is stored in the instance ``__dict__``, so
+    later accesses are a plain instance attribute lookup, with no extra Python frame for each call.
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        meth = instance.__dict__[self.name] = getattr(instance.rpc, self.name)
+        return meth
+
+
+_PASSTHRU_NAMES = tuple(
+    n for n, a in vars(MoneroRPC).items()
+    if not n.startswith('_') and callable(a) and not isinstance(a, (property, staticmethod, classmethod))
+)
+"""Names of the :class:`.MoneroRPC` methods which :class:`.RPCWrapper` passes through via :class:`._RPCMethod`"""
+
+# Unknown attributes still fall back to ``RPCWrapper.__getattr__``
+for _name in _PASSTHRU_NAMES:
+    if not hasattr(RPCWrapper, _name):
+        setattr(RPCWrapper, _name, _RPCMethod(_name))
+del _name
+
+
 class MoneroWallet(RPCWrapper):
     """
     Monero wallet ``with`` wrapper. Opens wallet at start of ``with``, saves wallet after exiting ``with`` statement.
@@ -60,31 +222,27 @@ class MoneroWallet(RPCWrapper):
         log.debug('MoneroWallet exiting. Saving wallet.')
         self.rpc.store()
 
-    def __getattr__(self, name):
-        """
-        Pass any unknown attributes as if they were calls to our MoneroRPC.
-
-        :param name: Name of the attribute requested
-        :return: Dict or List from call result
-        """
-
-        def c(*args, **kwargs):
-            return getattr(self.rpc, name)(*args, **kwargs)
-
-        return c
-
 
 class MoneroMixin(SettingsMixin, ABC):
     setting_defaults = dict(
         host='127.0.0.1', port=18100, user=None, password=None, wallet='default', walletpass=None,
-        account=None, account_id=None, confirms_needed=1
+        account=None, account_id=None, confirms_needed=1, min_height=None
     )
     rpcs: Dict[str, MoneroRPC]
-    _account_ids = {}
+    rpc_pool_size = 4
+    """Number of RPC objects (each with their own HTTP session) in each symbol's :py:meth:`.rpc_any` pool"""
 
     def __init__(self, settings: Dict[str, dict], *args, **kwargs):
         if not hasattr(self, 'wallet_opened'):
             self.wallet_opened = False
+        self._in_wallet_ctx = False
+        self._wallet_open_lock = threading.Lock()
+        self._rpc_wrappers = {}  # type: Dict[str, RPCWrapper]
+        self._class_name = type(self).__name__
+        self._account_ids = {}  # type: Dict[str, int]
+        """Resolved account IDs mapped by symbol (see :py:meth:`.account_id`)"""
+        self._rpc_pools = {}  # type: Dict[str, Iterator[MoneroRPC]]
+        """Round-robin pools of read-only RPC objects mapped by symbol (see :py:meth:`.rpc_any`)"""
         super().__init__(*args, settings=settings, **kwargs)
 
     def wallet(self, symbol: str = 'XMR') -> Union[MoneroRPC, RPCWrapper]:
@@ -102,15 +260,96 @@ class MoneroMixin(SettingsMixin, ABC):
         :param str symbol: The coin symbol to initialise a wallet instance for
         :return MoneroWallet wallet: An instance of MoneroWallet for use with a ``with`` statement.
         """
-        # If wallet_opened is True, then this class instance is already being used with ``with``, so we
-        # don't need to call open_wallet() for every call - thus we use the simple RPCWrapper scaffolding
-        if self.wallet_opened:
-            return RPCWrapper(self.rpcs[symbol])
+        # If this class instance is being used with ``with``, then the wallet only needs to be opened once (upon the
+        # first wallet call) rather than for every call - thus we use the simple RPCWrapper scaffolding
+        if self._ensure_wallet_open():
+            rpc = self.rpcs[symbol]
+            w = self._rpc_wrappers.get(symbol)
+            # Re-use the same wrapper (and it's already bound methods), unless the RPC object has been replaced
+            if w is None or w.rpc is not rpc:
+                w = self._rpc_wrappers[symbol] = RPCWrapper(rpc)
+            return w
         # Otherwise, the class instance doesn't seem to be in a ``with`` statement, so use MoneroWallet to
         # handle automatically opening the wallet, and calling store() when done.
         s = self.settings[symbol]
         return MoneroWallet(rpc=self.rpcs[symbol], wallet=s['wallet'], walletpass=s['walletpass'])
 
+    wallet_ready_timeout = 3.0
+    """Maximum number of seconds :py:meth:`._wait_for_rpc` waits for the wallet RPC to respond before giving up"""
+
+    def _wait_for_rpc(self, symbol: str = 'XMR') -> bool:
+        """
+        Poll ``get_version`` on the wallet RPC for ``symbol`` until it responds (e.g. after a previous wallet was
+        closed), rather than waiting for a fixed amount of time. Polls back off exponentially from 50ms, for at most
+        :py:attr:`.wallet_ready_timeout` seconds. Probes use :py:attr:`.PROBE_SESSION`, which never retries.
+
+        :return bool ready: ``True`` if the RPC responded, ``False`` if it never did within the timeout
+        """
+        # A separate RPC object, so the per-request timeout can be set without affecting calls made using self.rpcs
+        probe = MoneroRPC(**self._rpc_settings(symbol))
+        probe.req = PROBE_SESSION
+        deadline, delay = monotonic() + self.wallet_ready_timeout, 0.05
+        while True:
+            # Each probe may take no longer than the time we have left, so a hung RPC can't stretch the wait
+            probe.timeout = max(deadline - monotonic(), 0.05)
+            try:
+                probe.call('get_version')
+                return True
+            except Exception as e:
+                log.debug('Wallet RPC for %s not ready yet (%s: %s)', symbol, type(e).__name__, str(e))
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            sleep(min(delay, remaining))
+            delay *= 2
+        log.warning('Wallet RPC for %s did not respond within %s seconds', symbol, self.wallet_ready_timeout)
+        return False
+
+    def _open_wallet_ctx(self):
+        """
+        Called when a manager / loader enters a ``with`` statement (see ``__enter__``).
+
+        The ``XMR`` wallet isn't opened here, as the ``with`` block may only make calls which don't need a wallet
+        (e.g. ``validate_address``). Instead, :py:meth:`._ensure_wallet_open` opens it upon the first wallet-scoped
+        call (e.g. via :py:meth:`.wallet`).
+        """
+        log.debug('%s entering with statement', self._class_name)
+        self._in_wallet_ctx = True
+        return self
+
+    def _ensure_wallet_open(self) -> bool:
+        """
+        Open the ``XMR`` wallet if we're inside of a ``with`` statement, and it hasn't been opened yet.
+
+        :return bool opened: ``True`` if the wallet is open (whether or not it was opened by this call)
+        """
+        if self.wallet_opened or not self._in_wallet_ctx:
+            return self.wallet_opened
+        with self._wallet_open_lock:
+            if self.wallet_opened:
+                return True
+            s = self.xmr_settings
+            if empty(s['wallet']):
+                log.debug('%s: No wallet specified for XMR. Not opening any wallet.', self._class_name)
+                return False
+
+            self._wait_for_rpc('XMR')
+            log.debug('Opening wallet %s', s['wallet'])
+            self.rpcs['XMR'].open_wallet(filename=s['wallet'], password=s['walletpass'])
+            log.debug('Wallet opened')
+            self.wallet_opened = True
+        return True
+
+    def _close_wallet_ctx(self):
+        """Saves the ``XMR`` wallet (if it was opened) when a manager / loader leaves a ``with`` statement"""
+        self._in_wallet_ctx = False
+        if not self.wallet_opened:
+            log.debug('%s exiting. Wallet was never opened. Not calling store().', self._class_name)
+            return self
+        log.debug('%s exiting. Calling store()', self._class_name)
+        self.rpcs['XMR'].store()
+        self.wallet_opened = False
+
     def find_account_label(self, label: str, symbol: str = 'XMR') -> dict:
         """
         Find a Monero wallet account by it's label/tag
@@ -134,21 +373,35 @@ class MoneroMixin(SettingsMixin, ABC):
                     return a
         raise AccountNotFound(f"No monero account with the label '{label}' could be found.")
 
+    async def find_account_label_async(self, label: str, symbol: str = 'XMR') -> dict:
+        """
+        Async version of :py:meth:`.find_account_label` - runs it in the event loop's default executor, so label
+        lookups on different wallet RPCs can be made concurrently, e.g. with ``asyncio.gather``.
+        """
+        loop = running_loop()
+        return await loop.run_in_executor(None, self.find_account_label, label, symbol)
+
     @property
     def xmr_settings(self):
         return self.settings.get('XMR', self.setting_defaults)
 
     def account_id(self, symbol: str = 'XMR') -> int:
-        """Get the default account ID/index for a given coin symbol"""
+        """
+        Get the default account ID/index for a given coin symbol.
+
+        The result is cached on the instance per symbol. Use :py:meth:`.prefetch_accounts` to resolve the account IDs
+        for all symbols upfront.
+        """
         # First check if we've cached the account ID for this symbol
         if symbol in self._account_ids:
             return self._account_ids[symbol]
 
-        # Next in priority is the `account_id` setting
         s = self.settings[symbol]
+        # Next in priority is the `account_id` setting
         if not empty(s.get('account_id')):
             a_id = self._account_ids[symbol] = int(s.get('account_id'))
-            log.debug("Using setting 'account_id' = '%s' for the monero account ID", a_id)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Using setting 'account_id' = '%s' for the monero account ID", a_id)
             return a_id
 
         # If `account` is set, then we search for an account with the label or tag matching `account`
@@ -165,9 +418,39 @@ class MoneroMixin(SettingsMixin, ABC):
         self._account_ids[symbol] = 0
         return self._account_ids[symbol]
 
+    def prefetch_accounts(self) -> Dict[str, int]:
+        """
+        Resolve (and cache) the account ID for every symbol with an RPC, so the first :py:meth:`.account_id` call for
+        each symbol doesn't need an RPC call. Symbols which look up their account by label share a single
+        ``get_accounts`` call per wallet.
+
+        :return dict account_ids: The resolved account IDs, mapped by symbol
+        """
+        by_wallet = {}  # type: Dict[Tuple[str, int, str], List[str]]
+        for sym in self.rpcs.keys():
+            s = self.settings[sym]
+            if sym in self._account_ids or not empty(s.get('account_id')) or empty(s.get('account')):
+                self.account_id(sym)
+                continue
+            rpc = self.rpcs[sym]
+            by_wallet.setdefault((rpc.hostname, rpc.port, s.get('wallet')), []).append(sym)
+
+        for syms in by_wallet.values():
+            with self.wallet(syms[0]) as w:  # type: MoneroRPC
+                accs = w.get_accounts()['subaddress_accounts']
+            for sym in syms:
+                label = self.settings[sym]['account'].lower()
+                for a in accs:
+                    if a['label'].lower() == label or a['tag'].lower() == label:
+                        self._account_ids[sym] = int(a['account_index'])
+                        break
+                else:
+                    raise AccountNotFound(f"No monero account with the label '{label}' could be found.")
+        return dict(self._account_ids)
+
     def get_address(self, address: str, symbol: str = 'XMR') -> dict:
+        account_id = self.account_id(symbol=symbol)
         with self.wallet(symbol) as w:  # type: MoneroRPC
-            account_id = self.account_id(symbol=symbol)
             _addresses = w.get_address(account_index=account_id)
             addresses: List[dict] = _addresses['addresses']
             for a in addresses:
@@ -175,28 +458,55 @@ class MoneroMixin(SettingsMixin, ABC):
                     return a
             raise AccountNotFound(f'The address "{address}" could not be found.')
 
+    def _prep_settings(self, reset: bool = False) -> Dict[str, dict]:
+        if reset:
+            # Account IDs and pooled RPC objects were created using the old settings, so forget them.
+            self._account_ids = {}
+            self._rpc_pools = {}
+        return super()._prep_settings(reset=reset)
+
     def _rpc_settings(self, symbol: str) -> dict:
-        """Generate a dict that can be passed via BitcoinRPC's kwargs using the passed symbol's settings"""
+        """Generate a dict that can be passed via MoneroRPC's kwargs using the passed symbol's settings"""
         s = self._prep_settings()[symbol]
-        rs = {k: v for k, v in s if k in ['port', 'password']}
-        rs += dict(username=s['user'], hostname=s['host'])
-        return rs
+        return {'hostname': s['host'], 'port': int(s['port']), 'username': s.get('user'), 'password': s.get('password')}
 
     def _cast_settings(self, s: Dict[str, Any]):
         s['port'] = int(s['port'])
+        if not empty(s.get('min_height')):
+            s['min_height'] = int(s['min_height'])
 
     def _get_rpcs(self) -> Dict[str, MoneroRPC]:
-        """Returns a dict mapping coin symbols to their RPC objects"""
+        """
+        Returns a dict mapping coin symbols to their RPC objects.
+
+        Every RPC object uses the module level :py:attr:`.SESSION`, so HTTP keep-alive connections (and their pool)
+        are shared across all symbols, managers and loaders rather than each RPC object opening it's own connections.
+        """
         rpcs = {}
 
-        for sym, conn in self._prep_settings().items():
-            rpcs[sym] = MoneroRPC(
-                hostname=conn['host'],
-                port=conn['port'],
-                username=conn.get('user'),
-                password=conn.get('password')
-            )
+        for sym in self._prep_settings().keys():
+            rpcs[sym] = RetryMoneroRPC(**self._rpc_settings(sym))
+            rpcs[sym].req = SESSION
         return rpcs
 
+    def rpc_any(self, symbol: str = 'XMR') -> MoneroRPC:
+        """
+        Returns one of a small pool of :py:attr:`.rpc_pool_size` RPC objects for ``symbol``, in round-robin order.
+
+        Each pooled RPC object has it's own :class:`requests.Session`, so threads making independent **read-only**
+        calls which don't need a wallet to be opened (e.g. ``validate_address``, ``get_version``) don't share a
+        session. Anything which changes state (``open_wallet``, ``store``, ``transfer`` etc.) should use
+        ``self.rpcs[symbol]`` instead.
+        """
+        pool = self._rpc_pools.get(symbol)
+        if pool is None:
+            clients = []
+            for _ in range(self.rpc_pool_size):
+                rpc = RetryMoneroRPC(**self._rpc_settings(symbol))
+                rpc.req = _make_session()
+                clients.append(rpc)
+            pool = self._rpc_pools[symbol] = itertools.cycle(clients)
+        return next(pool)
+
 
 
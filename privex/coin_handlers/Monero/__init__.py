@@ -26,6 +26,8 @@ It will automatically handle any :class:`payments.models.Coin` which has it's ty
     Extra JSON (Handler Custom) config options:
 
     - ``confirms_needed`` Default 0; Amount of confirmations needed before loading a TX
+    - ``min_height``      Default None; If set, only transfers from this block height onwards are loaded, rather than
+      the entire wallet history
 
 **Django Settings**:
 
@@ -109,9 +111,9 @@ def reload():
     global loaded
     loaded = True
 
-    # Grab a simple list of coin symbols with the type COIN_TYPE to populate the provides lists.
+    # Grab a set of coin symbols with the type COIN_TYPE to populate the provides sets (a frozenset for fast ``in``).
     # provides = Coin.objects.filter(coin_type=COIN_TYPE).values_list('symbol', flat=True)
-    provides = [coin.symbol for coin in handler_coins]
+    provides = frozenset(coin.symbol for coin in handler_coins)
     MoneroLoader.provides = provides
     MoneroManager.provides = provides
     # Since the handler is re-loading, we wipe the settings cache to ensure stale connection details aren't used.
@@ -69,16 +69,18 @@ OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
 Except as contained in this notice, the name(s) of the above copyright holders shall not be used in advertising or 
 otherwise to promote the sale, use or other dealings in this Software without prior written authorization.
 """
+import functools
 import logging
+import os
 import sys
-from typing import Dict, List, Union, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Union, Any, Tuple, Set, Generator, Optional
 from importlib import import_module
+import attr
 from privex.helpers import is_false
 from privex.coin_handlers.base import BaseLoader, BaseManager, BatchLoader, Coin, Deposit, decorators, \
     exceptions, retry_on_err, SettingsMixin
 from privex.coin_handlers.KeyStore import KeyStore, KeyPair, MemoryKeyStore, get_key_store, set_key_store
-from privex.coin_handlers.Bitcoin import BitcoinLoader, BitcoinManager, BitcoinMixin
-from privex.coin_handlers.Monero import MoneroLoader, MoneroManager, MoneroMixin
 
 name = 'coin_handlers'
 
@@ -94,10 +96,53 @@ if len(_l.handlers) == 0:
     _l.setLevel(logging.WARNING)
     _l.addHandler(_handler)
 
-try:
-    from privex.coin_handlers.KeyStore import DjangoKeyStore
-except ImportError as e:
-    log.debug('privex.coin_handlers __init__ failed to import DjangoKeyStore: %s', str(e))
+_LAZY_EXPORTS = {
+    'BitcoinLoader': 'privex.coin_handlers.Bitcoin', 'BitcoinManager': 'privex.coin_handlers.Bitcoin',
+    'BitcoinMixin': 'privex.coin_handlers.Bitcoin',
+    'MoneroLoader': 'privex.coin_handlers.Monero', 'MoneroManager': 'privex.coin_handlers.Monero',
+    'MoneroMixin': 'privex.coin_handlers.Monero',
+}
+"""
+Handler classes which can be imported from this module, mapped to the module they're from. They're only imported
+upon first access (see :py:func:`.__getattr__`), so using e.g. just the Monero handler doesn't import Bitcoin's.
+"""
+
+
+def __getattr__(name: str):
+    """
+    Lazily import the handler classes in :py:attr:`._LAZY_EXPORTS` upon first access, e.g.
+    ``from privex.coin_handlers import MoneroManager`` (PEP 562).
+    """
+    if name in _LAZY_EXPORTS:
+        obj = globals()[name] = getattr(import_module(_LAZY_EXPORTS[name]), name)
+        return obj
+    # DjangoKeyStore only exists if Django is installed, so it isn't part of _LAZY_EXPORTS
+    if name == 'DjangoKeyStore':
+        try:
+            obj = globals()[name] = getattr(import_module('privex.coin_handlers.KeyStore'), name)
+            return obj
+        except AttributeError as e:
+            log.debug('privex.coin_handlers __init__ failed to import DjangoKeyStore: %s', str(e))
+    # The handler packages themselves (e.g. ``privex.coin_handlers.Monero``) used to be imported eagerly, so they
+    # need to stay accessible as attributes of this module.
+    if f'{__name__}.{name}' in _LAZY_EXPORTS.values():
+        return import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported handler classes in ``dir()``, so they're still found by tab completion etc."""
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ is only supported on Python 3.7+, so we have to import them immediately.
+    for _attr in _LAZY_EXPORTS:
+        __getattr__(_attr)
+    try:
+        __getattr__('DjangoKeyStore')
+    except AttributeError:
+        pass
 
 
 handlers = {}    # type: Dict[ str, Dict[str, List[Union[BaseLoader, BaseManager]] ] ]
@@ -122,6 +167,45 @@ Example layout::
 handlers_loaded = False
 """Used to track whether the Coin Handlers have been initialized, so reload_handlers can be auto-called."""
 
+_pending_handlers = {}   # type: Dict[str, List[Tuple[str, Any]]]
+"""
+Maps each coin symbol to a list of ``(handler_name, lazy_module)`` tuples for the enabled handlers which provide
+that symbol. Populated by :py:func:`.reload_handlers` - the handler modules aren't actually imported until
+:py:func:`._materialize` is called for one of their symbols.
+"""
+
+_loaded_syms = set()   # type: Set[str]
+"""Coin symbols which have already been materialized by :py:func:`._materialize` since the last reload"""
+
+_loaded_handlers = set()   # type: Set[str]
+"""Names of handlers (e.g. ``Bitcoin``) which have been imported and added to ``handlers`` since the last reload"""
+
+_module_cache = {}   # type: Dict[str, Any]
+"""
+Maps handler module paths to the :py:func:`.lazy_import` proxy created for them, so repeated calls to
+:py:func:`.reload_handlers` re-use the same module object instead of re-importing it each time.
+"""
+
+_last_reload = {}   # type: Dict[str, tuple]
+"""
+Maps handler module paths to the signature (source mtime + ``handler_coins``) they had when their ``reload()`` was
+last called by :py:func:`._load_handler`, so that unchanged handlers don't need to be reloaded again.
+"""
+
+_COIN_FIELDS = frozenset(attr.fields_dict(Coin))
+"""The names of the fields on :class:`.Coin` - used by :py:func:`.configure_coin` to update a coin's attributes"""
+
+_handler_sym_cache = {}   # type: Dict[str, Tuple[Tuple[str, ...], Set[str]]]
+"""
+Maps handler names to a tuple of ``(coin_symbols, symbols)`` - used by :py:func:`._handler_symbols`
+"""
+
+_last_config = None   # type: Optional[tuple]
+"""
+A frozen copy (see :py:func:`._freeze`) of ``CH_BASE``, ``COIN_HANDLERS`` and ``HANDLER_SETTINGS`` as they were during
+the last :py:func:`.reload_handlers` call - used to skip reloading the handlers when their config hasn't changed.
+"""
+
 CH_BASE = 'privex.coin_handlers'
 """Base module path to where the coin handler modules are located. E.g. payments.coin_handlers"""
 
@@ -215,7 +299,27 @@ Example for :py:mod:`.Bitcoin` :
 
 """
 
-log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=256)
+def canonical_symbol(symbol: str) -> str:
+    """
+    Returns ``symbol`` in the form used for the keys of ``handlers`` - upper case, and interned.
+
+    Results are memoized, so the symbols queried most often aren't upper-cased and interned again on every call.
+
+    If you're querying the same symbol many times (e.g. a symbol parsed from each incoming request), calling this once
+    and passing the result to :py:func:`.get_manager` / :py:func:`.get_loader` allows the handler lookups to match
+    on identity, rather than comparing the strings.
+
+        >>> sym = canonical_symbol('btc')
+        >>> sym
+        'BTC'
+        >>> get_manager(sym)
+
+    :param str symbol: A coin symbol (case insensitive)
+    :return str symbol: The upper case, interned symbol
+    """
+    return sys.intern(symbol.upper())
 
 
 def _handler(handler: str) -> dict:
@@ -270,7 +374,7 @@ def configure_coin(symbol: str, **config_opts):
     :param Any config_opts: Keyword args for each setting you want to adjust
     :return dict coin_settings: A ``dict`` containing the current settings for the coin
     """
-    symbol = symbol.upper()
+    symbol = canonical_symbol(symbol)
 
     c_rpc = HANDLER_SETTINGS['COIND_RPC']
     if symbol not in c_rpc:
@@ -278,9 +382,14 @@ def configure_coin(symbol: str, **config_opts):
     c_rpc[symbol] = {**c_rpc[symbol], **config_opts}
     
     if symbol in COIN_MAP:
-        for k, v in config_opts.items():
-            if hasattr(COIN_MAP[symbol], k):
-                setattr(COIN_MAP[symbol], k, v)
+        coin = COIN_MAP[symbol]
+        for k in config_opts.keys() & _COIN_FIELDS:
+            setattr(coin, k, config_opts[k])
+
+    # Make sure any already loaded handlers for this coin don't keep returning the old settings from get_setting()
+    entry = handlers.get(symbol, {})
+    for h in entry.get('loaders', []) + entry.get('managers', []):
+        h.invalidate_setting(symbol)
     
     return c_rpc[symbol]
 
@@ -300,13 +409,24 @@ def configure_handler(handler: str, **config_opts):
     COIN_HANDLERS[handler] = {**COIN_HANDLERS[handler], **config_opts}
 
 
+def _handler_symbols(handler: str) -> Set[str]:
+    """
+    Internal function. Returns the set of (upper case) symbols in a handler's coin list, so that
+    :py:func:`.handler_has_coin` doesn't have to scan the list.
+
+    The set is cached in :py:attr:`._handler_sym_cache`, keyed on the tuple of symbols in the handler's ``coins`` list,
+    so it's re-generated whenever the list is replaced or modified (including coins being swapped out in-place).
+    """
+    key = tuple(c.symbol for c in _handler(handler)['coins'])
+    cached = _handler_sym_cache.get(handler)
+    if cached is None or cached[0] != key:
+        cached = _handler_sym_cache[handler] = (key, {canonical_symbol(sym) for sym in key})
+    return cached[1]
+
+
 def handler_has_coin(handler: str, symbol: str) -> bool:
     """Returns ``True`` if the given ``symbol`` is in a handler's coin list"""
-    chc = _handler(handler)['coins']
-    for coin in chc:
-        if coin.symbol.upper() == symbol.upper():
-            return True
-    return False
+    return canonical_symbol(symbol) in _handler_symbols(handler)
 
 
 def add_handler_coin(handler: str, coin: Union[Coin, str]):
@@ -321,58 +441,97 @@ def add_handler_coin(handler: str, coin: Union[Coin, str]):
 
     :param str handler:   The name of a handler, e.g. ``Bitcoin``
     :param Coin|str coin: Either a :class:`.Coin` object, or a string symbol which exists in :py:attr:`.COIN_MAP`
-    :return:
+    :return bool added: ``True`` if the coin was added, ``False`` if the handler already had it
     """
-    if type(coin) is str:
-        coin = coin.upper()
-        if coin not in COIN_MAP:
-            raise exceptions.TokenNotFound(f'Requested symbol "{coin}" not found in COIN_MAP')
-        coin = COIN_MAP[coin]
-    sym = coin.symbol
-    if handler_has_coin(handler, sym):
-        return False
+    return add_handler_coins(handler, coin) > 0
 
-    ch = _handler(handler)
-    ch['coins'].append(coin)
-    if coin.symbol not in COIN_MAP:
-        COIN_MAP[coin.symbol] = coin
-    return True
 
+def add_handler_coins(handler: str, *coins: Union[Coin, str]) -> int:
+    """
+    Add multiple :class:`.Coin` 's to a handler's enabled coin list at once, skipping any that are already there.
+
+    Faster than calling :py:func:`.add_handler_coin` for each coin when adding a lot of coins to a handler.
+
+    Example:
+
+        >>> add_handler_coins('Bitcoin', 'BTC', Coin(symbol='LTC', symbol_id='LTC'), Coin(symbol='DOGE'))
+        3
 
-def get_loaders(symbol: str = None) -> Union[Tuple[str, List[BaseLoader]], List[BaseLoader]]:
+    :param str handler:    The name of a handler, e.g. ``Bitcoin``
+    :param Coin|str coins: :class:`.Coin` objects, and/or string symbols which exist in :py:attr:`.COIN_MAP`
+    :raises exceptions.TokenNotFound: When a string symbol isn't in ``COIN_MAP`` (no coins will have been added)
+    :return int added: The number of coins which were added to the handler
+    """
+    # Resolve all of the symbols first, so that an unknown symbol doesn't result in only some coins being added
+    resolved = []
+    for coin in coins:
+        if type(coin) is str:
+            coin = canonical_symbol(coin)
+            if coin not in COIN_MAP:
+                raise exceptions.TokenNotFound(f'Requested symbol "{coin}" not found in COIN_MAP')
+            coin = COIN_MAP[coin]
+        resolved.append(coin)
+
+    syms = set(_handler_symbols(handler))
+    new = []
+    for coin in resolved:
+        sym = canonical_symbol(coin.symbol)
+        if sym in syms:
+            continue
+        syms.add(sym)
+        new.append(coin)
+        if coin.symbol not in COIN_MAP:
+            COIN_MAP[coin.symbol] = coin
+
+    coins_list = _handler(handler)['coins']
+    coins_list.extend(new)
+    # Keep the cached symbol set in sync, rather than having the next handler_has_coin() re-generate it
+    _handler_sym_cache[handler] = (tuple(c.symbol for c in coins_list), syms)
+    return len(new)
+
+
+def get_loaders(symbol: str = None) -> Union[Generator[Tuple[str, List[BaseLoader]], None, None], List[BaseLoader]]:
     """
     Get all loader's, or all loader's for a certain coin
 
-    :param symbol: The coin symbol to get all loaders for (uppercase)
-    :return list: If symbol not specified, a list of tuples (symbol, list<BaseLoader>,)
+    :param symbol: The coin symbol to get all loaders for (case insensitive)
+    :return Generator: If symbol not specified, a generator of tuples (symbol, list<BaseLoader>,)
     :return list: If symbol IS specified, a list of instantiated :class:`base.BaseLoader`'s
     """
-    if not handlers_loaded: reload_handlers()
-    return [(s, data['loaders'],) for s, data in handlers.items()] if symbol is None else handlers[symbol]['loaders']
+    if symbol is None:
+        if not handlers_loaded: reload_handlers()
+        _materialize_all()
+        return ((s, data['loaders'],) for s, data in handlers.items())
+    symbol = _ensure_handler_loaded(symbol)
+    return handlers[symbol]['loaders']
 
 
 def has_manager(symbol: str) -> bool:
     """Helper function - does this symbol have a manager class?"""
-    if not handlers_loaded: reload_handlers()
-    return symbol.upper() in handlers and len(handlers[symbol].get('managers', [])) > 0
+    symbol = _ensure_handler_loaded(symbol)
+    return symbol in handlers and len(handlers[symbol].get('managers', [])) > 0
 
 
 def has_loader(symbol: str) -> bool:
     """Helper function - does this symbol have a loader class?"""
-    if not handlers_loaded: reload_handlers()
-    return symbol.upper() in handlers and len(handlers[symbol].get('loaders', [])) > 0
+    symbol = _ensure_handler_loaded(symbol)
+    return symbol in handlers and len(handlers[symbol].get('loaders', [])) > 0
 
 
-def get_managers(symbol: str = None) -> Union[Tuple[str, List[BaseManager]], List[BaseManager]]:
+def get_managers(symbol: str = None) -> Union[Generator[Tuple[str, List[BaseManager]], None, None], List[BaseManager]]:
     """
     Get all manager's, or all manager's for a certain coin
 
-    :param symbol: The coin symbol to get all managers for (uppercase)
-    :return list: If symbol not specified, a list of tuples (symbol, list<BaseManager>,)
+    :param symbol: The coin symbol to get all managers for (case insensitive)
+    :return Generator: If symbol not specified, a generator of tuples (symbol, list<BaseManager>,)
     :return list: If symbol IS specified, a list of instantiated :class:`base.BaseManager`'s
     """
-    if not handlers_loaded: reload_handlers()
-    return [(s, data['managers'],) for s, data in handlers.items()] if symbol is None else handlers[symbol]['managers']
+    if symbol is None:
+        if not handlers_loaded: reload_handlers()
+        _materialize_all()
+        return ((s, data['managers'],) for s, data in handlers.items())
+    symbol = _ensure_handler_loaded(symbol)
+    return handlers[symbol]['managers']
 
 
 def get_manager(symbol: str) -> BaseManager:
@@ -382,11 +541,10 @@ def get_manager(symbol: str) -> BaseManager:
         >>> m = get_manager('ENG')
         >>> m.send(amount=Decimal(1), from_address='someguy123', address='privex')
 
-    :param symbol:         The coin symbol to get the manager for (uppercase)
+    :param symbol:         The coin symbol to get the manager for (case insensitive)
     :return BaseManager:   An instance implementing :class:`base.BaseManager`
     """
-    if not handlers_loaded: reload_handlers()
-    return handlers[symbol]['managers'][0]
+    return _manager_for(canonical_symbol(symbol))
 
 
 def get_loader(symbol: str) -> BaseLoader:
@@ -396,74 +554,389 @@ def get_loader(symbol: str) -> BaseLoader:
         >>> m = get_loader('ENG')
         >>> m.send(amount=Decimal(1), from_address='someguy123', address='privex')
 
-    :param symbol:        The coin symbol to get the loader for (uppercase)
+    :param symbol:        The coin symbol to get the loader for (case insensitive)
     :return BaseLoader:   An instance implementing :class:`base.BaseLoader`
     """
-    if not handlers_loaded: reload_handlers()
-    return handlers[symbol]['loaders'][0]
+    return _loader_for(canonical_symbol(symbol))
+
+
+class _LazyModule:
+    """
+    A proxy for a module which is only imported the first time an attribute is accessed on it.
+
+    Don't construct this directly, use :py:func:`.lazy_import` instead.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        self._module = None
+
+    def _load(self):
+        """Imports the proxied module (if it hasn't been already) and returns it"""
+        if self._module is None:
+            log.debug('Lazy importing module %s', self._path)
+            self._module = import_module(self._path)
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        return f'<_LazyModule {self._path} loaded={self._module is not None}>'
+
+
+def lazy_import(path: str) -> Any:
+    """
+    Returns a proxy object for the module ``path``, which won't actually be imported until an attribute is
+    accessed on it, allowing heavy modules (e.g. coin handlers) to be referenced without paying their import cost.
+
+        >>> btc = lazy_import('privex.coin_handlers.Bitcoin')   # Nothing has been imported yet
+        >>> btc.exports['loader']                                # privex.coin_handlers.Bitcoin is imported here
+        <class 'privex.coin_handlers.Bitcoin.BitcoinLoader.BitcoinLoader'>
+
+    This is used rather than :class:`importlib.util.LazyLoader`, as a ``LazyLoader`` module is placed into
+    ``sys.modules`` before it's executed (so a failing handler import would leave a broken module behind), and it
+    doesn't support :func:`importlib.reload`.
+
+    :param str path: The fully qualified module path to import, e.g. ``privex.coin_handlers.Bitcoin``
+    :return _LazyModule module: A proxy which forwards attribute access to the module once it's imported
+    """
+    return _LazyModule(path)
 
 
 def add_handler(handler, handler_name, handler_type):
     """
-    Internal function. Used by :py:func:`.reload_handlers` to initialise handlers for usage.
+    Internal function. Used by :py:func:`._load_handler` to initialise handlers for usage.
 
     :param handler: An un-instantiated handler class based on :class:`.BaseLoader` / :class:`.BaseManager`
     :param str handler_name: The unique name of the handler, e.g. ``Bitcoin``
     :param str handler_type: The type of handler class it is, either ``managers`` or ``loaders``
+
+    Note: each symbol gets it's own loader / manager instance (loaders are constructed with ``coins=[coin]``), so
+    ``get_loader('LTC').list_txs()`` only returns LTC deposits, even if the same handler also provides BTC.
+
+    All of the instances are constructed before any are registered, so if one of them fails to construct, none of
+    them are added to ``handlers``.
+
+    :return list added: A list of ``(symbol, handler_type, instance)`` tuples for each instance that was registered
     """
     global handlers
+    ch = COIN_HANDLERS[handler_name]
+    # Bind the settings and the handler's extra kwargs once, rather than re-merging them for every coin
+    ctor = functools.partial(handler, settings=HANDLER_SETTINGS, **(ch.get('kwargs') or {}))
+    is_loader = handler_type == 'loaders'
+
     # `handler` is an un-instantiated class extending BaseLoader / BaseManager
-    for coin in COIN_HANDLERS[handler_name]['coins']:
-        sym = coin.symbol
-        if sym not in handlers:
-            handlers[sym] = dict(loaders=[], managers=[])
-        kwargs = dict(coin=coin) if handler_type == 'managers' else dict(coins=[coin])
-        kwargs = {**kwargs, **COIN_HANDLERS[handler_name].get('kwargs', {})}
-        h = handler(settings=HANDLER_SETTINGS, **kwargs)
-        handlers[sym][handler_type].append(h)
+    # Symbols are always stored in upper case, as that's what the get_* / has_* functions query by
+    added = [
+        (canonical_symbol(coin.symbol), handler_type, ctor(coins=[coin]) if is_loader else ctor(coin=coin))
+        for coin in ch['coins']
+    ]
+    for sym, _, h in added:
+        entry = handlers.get(sym)
+        if entry is None:
+            entry = handlers[sym] = dict(loaders=[], managers=[])
+        entry[handler_type].append(h)
+    return added
+
+
+def _load_handler(ch: str, mod):
+    """
+    Internal function. Imports the handler module ``mod`` (if it hasn't been already), then initialises it's
+    loader / manager for each of it's coins using :py:func:`.add_handler`
+
+    :param str ch: The name of the handler, e.g. ``Bitcoin``
+    :param mod: The handler module, or a lazy proxy returned by :py:func:`.lazy_import`
+    :raises Exception: Any exception raised while constructing the handler's loaders / managers. None of the
+                       handler's instances are left registered, and it will be retried the next time it's needed.
+    """
+    try:
+        log.debug('Loading coin handler %s', ch)
+        # To avoid a handler's initialising code being ran every time the module is imported, a handler's init file
+        # can define a reload() function, which is only ran the first time the module is loaded.
+        # If the module was already imported before this reload_handlers() call, then we need to make sure we
+        # force reload those with a reload func. Freshly imported modules have already ran their own reload().
+        # Handlers whose source file and coin list haven't changed since their last reload() are skipped.
+        fresh = mod._module is None
+        if not fresh and hasattr(mod, 'reload'):
+            sig = _module_sig(mod)
+            if sig is None or _last_reload.get(mod._path) != sig:
+                mod.reload()
+                _last_reload[mod._path] = sig
+            else:
+                log.debug('Handler %s is unchanged since it was last reloaded. Not calling reload()', ch)
+        ex = mod.exports
+        if fresh:
+            # The module's own initialisation code has just ran reload() for us, so note it's current signature
+            _last_reload[mod._path] = _module_sig(mod)
+    except (ImportError, AttributeError, KeyError):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('COIN_HANDLERS %s', COIN_HANDLERS)
+            log.debug('COIN_MAP %s', COIN_MAP)
+            log.debug('HANDLER_SETTINGS %s', HANDLER_SETTINGS)
+        log.exception("Something went wrong loading the handler %s", ch)
+        log.error("Skipping this handler...")
+        _loaded_handlers.add(ch)
+        return
+
+    # Registration is kept outside of the try/except above, so that errors instantiating a handler's loader / manager
+    # are raised to the caller rather than the handler being silently skipped.
+    added = []
+    try:
+        if 'loader' in ex:
+            log.debug('Adding loader class for %s', ch)
+            added += add_handler(ex['loader'], ch, 'loaders')
+        if 'manager' in ex:
+            log.debug('Adding manager class for %s', ch)
+            added += add_handler(ex['manager'], ch, 'managers')
+    except Exception:
+        # Don't leave the handler half registered (e.g. with loaders but no managers)
+        for sym, htype, h in added:
+            handlers[sym][htype].remove(h)
+        raise
+    _loaded_handlers.add(ch)
+
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    for coin in COIN_HANDLERS[ch]['coins']:
+        sym = coin.symbol.upper()
+        hdic = handlers.get(sym, {})
+        for l in hdic.get('loaders', []):
+            log.debug('Symbol %s - Loader: %s', sym, type(l).__name__)
+        for l in hdic.get('managers', []):
+            log.debug('Symbol %s - Manager: %s', sym, type(l).__name__)
 
 
-def reload_handlers():
+def _module_sig(mod) -> Union[tuple, None]:
     """
-    Resets `handler` to an empty dict, then loads all ``COIN_HANDLER`` classes into the dictionary ``handlers``
-    using ``CH_BASE`` as the base module path to load from
+    Internal function. Returns a signature for an imported handler module, made up of the modification time of it's
+    source file, and the ``repr`` of it's ``handler_coins`` (which ``reload()`` generates it's ``provides`` from).
+
+    Returns ``None`` if the module has no ``__file__`` / it can't be stat'd, in which case it should always be reloaded.
     """
-    global handlers, handlers_loaded
+    try:
+        return os.path.getmtime(mod.__file__), repr(getattr(mod, 'handler_coins', None))
+    except (AttributeError, TypeError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _manager_for(symbol: str) -> BaseManager:
+    """Internal function. Memoized body of :py:func:`.get_manager` - cleared by :py:func:`.reload_handlers`"""
+    return handlers[_ensure_handler_loaded(symbol)]['managers'][0]
+
+
+@functools.lru_cache(maxsize=None)
+def _loader_for(symbol: str) -> BaseLoader:
+    """Internal function. Memoized body of :py:func:`.get_loader` - cleared by :py:func:`.reload_handlers`"""
+    return handlers[_ensure_handler_loaded(symbol)]['loaders'][0]
+
+
+def _ensure_handler_loaded(symbol: str) -> str:
+    """
+    Internal function. Makes sure the handlers for ``symbol`` are available in ``handlers``, only importing the
+    handler modules which provide ``symbol`` (see :py:func:`._materialize`).
+
+    :param str symbol: The coin symbol which is about to be queried from ``handlers`` (case insensitive)
+    :return str symbol: The symbol in uppercase, as used for the keys of ``handlers``
+    """
+    if not handlers_loaded: reload_handlers()
+    symbol = canonical_symbol(symbol)
+    _materialize(symbol)
+    return symbol
+
+
+def _materialize(symbol: str):
+    """
+    Internal function. Imports and initialises any pending handlers (see :py:attr:`._pending_handlers`) which
+    provide ``symbol``, so that only the handlers for coins which are actually used end up being loaded.
+
+    :param str symbol: The coin symbol which is about to be queried from ``handlers``
+    """
+    if symbol in _loaded_syms:
+        return
+    for ch, mod in _pending_handlers.get(symbol, []):
+        if ch not in _loaded_handlers:
+            _load_handler(ch, mod)
+    _loaded_syms.add(symbol)
+
+
+def _materialize_all():
+    """
+    Internal function. Calls :py:func:`._materialize` for every symbol which has a pending handler.
+
+    A handler which fails to initialise is logged and skipped, so that one broken handler doesn't stop every other
+    handler from being listed by e.g. :py:func:`.get_loaders`. Requesting one of it's symbols directly (e.g. via
+    :py:func:`.get_loader`) will still raise the error.
+    """
+    for sym in list(_pending_handlers.keys()):
+        try:
+            _materialize(sym)
+        except Exception:
+            log.exception('Failed to initialise the handler(s) for symbol %s - skipping it', sym)
+
+
+def _preload_module(mod):
+    """
+    Internal function. Used by :py:func:`.preload_handlers` to import a lazy handler module from a worker thread.
+
+    Import errors are only logged here - the handler will be skipped (and the error logged in full) by
+    :py:func:`._load_handler` when it's materialized.
+    """
+    try:
+        mod._load()
+        # Importing the module has just ran it's reload(), so note it's signature to avoid _load_handler re-running it
+        _last_reload[mod._path] = _module_sig(mod)
+    except ImportError as e:
+        log.debug('Failed to preload handler module %s: %s %s', mod._path, type(e).__name__, str(e))
+
+
+def preload_handlers(max_workers: int = 8):
+    """
+    Imports and initialises every enabled handler up-front, rather than on first use of one of their symbols.
+
+    Handler modules are imported concurrently using a thread pool, as most of their import time is spent loading
+    their dependencies from disk. The handlers are then registered into ``handlers`` from the calling thread.
+
+    Useful for long running applications which would rather pay the import cost at startup, than on the first
+    request for a coin.
+
+        >>> reload_handlers()
+        >>> preload_handlers()
+
+    :param int max_workers: The maximum number of handler modules to import at once
+    """
+    if not handlers_loaded: reload_handlers()
+    mods = {}
+    for pending in _pending_handlers.values():
+        for ch, mod in pending:
+            if ch not in _loaded_handlers and mod._module is None:
+                mods[ch] = mod
+    if len(mods) > 0:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(mods))) as ex:
+            list(ex.map(_preload_module, mods.values()))
+    _materialize_all()
+
+
+def _freeze(obj) -> Any:
+    """
+    Internal function. Returns a snapshot of ``obj`` which can be compared against a later snapshot using ``==``,
+    converting dicts / lists (and :class:`.Coin` objects, which are mutated in-place by :py:func:`.configure_coin`)
+    into tuples, so that in-place changes to ``obj`` don't also change the snapshot.
+    """
+    if isinstance(obj, dict):
+        return tuple((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_freeze(v) for v in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(obj)
+    if attr.has(type(obj)):
+        return type(obj), _freeze(attr.asdict(obj, recurse=False))
+    return obj
+
+
+def reload_handlers(force: bool = False):
+    """
+    Resets `handler` to an empty dict, then registers all enabled ``COIN_HANDLER`` modules (using ``CH_BASE`` as the
+    base module path to load from) against the symbols of the coins they handle.
+
+    The handler modules aren't imported, nor are their classes loaded into the dictionary ``handlers``, until one of
+    their symbols is first requested, e.g. via :py:func:`.get_loader` / :py:func:`.get_manager`.
+
+    If ``COIN_HANDLERS`` and ``HANDLER_SETTINGS`` haven't changed since the handlers were last loaded, this does
+    nothing, so that the existing loader / manager instances (and their RPC connections) can continue to be used.
+
+    :param bool force: (Default: ``False``) If ``True``, reload the handlers even if their config hasn't changed.
+    """
+    global handlers, handlers_loaded, _last_config
+    config = _freeze((CH_BASE, COIN_HANDLERS, HANDLER_SETTINGS))
+    if handlers_loaded and not force and config == _last_config:
+        log.debug('Handler config is unchanged since the last reload_handlers() - not reloading.')
+        return
+    _last_config = config
     handlers = {}
-    log.debug('--- Starting reload_handlers() ---')
+    _manager_for.cache_clear()
+    _loader_for.cache_clear()
+    _pending_handlers.clear()
+    _loaded_syms.clear()
+    _loaded_handlers.clear()
+    # Check the log level once, rather than having log.debug() check it for every handler / symbol
+    _dbg = log.isEnabledFor(logging.DEBUG)
+    if _dbg: log.debug('--- Starting reload_handlers() ---')
 
     for ch, ch_data in COIN_HANDLERS.items():
         if is_false(ch_data.get('enabled', True)):
-            log.debug("Skipping coin handler %s as it's disabled.", ch)
+            if _dbg: log.debug("Skipping coin handler %s as it's disabled.", ch)
             continue
-        try:
-            mod_path = '.'.join([CH_BASE, ch])
-            log.debug('Loading coin handler %s', mod_path)
-            i = import_module(mod_path)
-            # To avoid a handler's initialising code being ran every time the module is imported, a handler's init file
-            # can define a reload() function, which is only ran the first time the module is loaded.
-            # If reload_handlers() has been called, then we need to make sure we force reload those with a reload func.
-            if handlers_loaded and hasattr(i, 'reload'):
-                i.reload()
-            ex = i.exports
-            if 'loader' in ex:
-                log.debug('Adding loader class for %s', ch)
-                add_handler(ex['loader'], ch, 'loaders')
-            if 'manager' in ex:
-                log.debug('Adding manager class for %s', ch)
-                add_handler(ex['manager'], ch, 'managers')
-        except:
-            log.debug('COIN_HANDLERS %s', COIN_HANDLERS)
-            log.debug('COIN_MAP %s', COIN_MAP)
-            log.debug('HANDLER_SETTINGS %s', HANDLER_SETTINGS)
-            log.exception("Something went wrong loading the handler %s", ch)
-            log.error("Skipping this handler...")
+        mod_path = '.'.join([CH_BASE, ch])
+        if _dbg: log.debug('Registering coin handler %s', mod_path)
+        mod = _module_cache.get(mod_path)
+        if mod is None:
+            mod = _module_cache[mod_path] = lazy_import(mod_path)
+        for coin in ch_data.get('coins', []):
+            _pending_handlers.setdefault(canonical_symbol(coin.symbol), []).append((ch, mod))
 
     handlers_loaded = True
-    log.debug('All handlers:')
-    for sym, hdic in handlers.items():
-        for l in hdic.get('loaders', []):
-            log.debug('Symbol %s - Loader: %s', sym, type(l).__name__)
-        for l in hdic.get('managers', []):
-            log.debug('Symbol %s - Manager: %s', sym, type(l).__name__)
-    log.debug('--- End of reload_handlers() ---')
+    if _dbg:
+        log.debug('All pending handlers:')
+        for sym, pending in _pending_handlers.items():
+            log.debug('Symbol %s - Handlers: %s', sym, ', '.join(ch for ch, _ in pending))
+        log.debug('--- End of reload_handlers() ---')
+
+
+def reload_handler(name: str):
+    """
+    Re-registers a single handler (e.g. after adding a coin to it, or enabling / disabling it), without throwing away
+    the loaders / managers of every other handler like :py:func:`.reload_handlers` does.
+
+    The handler's existing loader / manager instances are removed from ``handlers``, and it's current coins are
+    registered as pending, so it's re-initialised the next time one of it's symbols is requested.
+
+        >>> add_handler_coin('Bitcoin', Coin(symbol='LTC'))
+        >>> reload_handler('Bitcoin')
+
+    :param str name: The name of the handler to reload, e.g. ``Bitcoin``
+    :raises KeyError: When ``name`` isn't a handler in ``COIN_HANDLERS``
+    """
+    ch_data = COIN_HANDLERS[name]
+    if not handlers_loaded:
+        return reload_handlers()
+    mod_path = '.'.join([CH_BASE, name])
+    _manager_for.cache_clear()
+    _loader_for.cache_clear()
+    _loaded_handlers.discard(name)
+
+    # Remove the handler's old registrations. Instances are matched by the module they were defined in, as
+    # handler classes always live within the handler's own module.
+    for sym in list(_pending_handlers.keys()):
+        pending = [p for p in _pending_handlers[sym] if p[0] != name]
+        if len(pending) == len(_pending_handlers[sym]):
+            continue
+        if len(pending) > 0:
+            _pending_handlers[sym] = pending
+        else:
+            del _pending_handlers[sym]
+        _loaded_syms.discard(sym)
+        entry = handlers.get(sym)
+        if entry is None:
+            continue
+        for k in ('loaders', 'managers'):
+            entry[k] = [h for h in entry[k] if not _defined_in(h, mod_path)]
+        if len(entry['loaders']) == 0 and len(entry['managers']) == 0:
+            del handlers[sym]
+
+    if is_false(ch_data.get('enabled', True)):
+        log.debug("Not re-registering coin handler %s as it's disabled.", name)
+        return
+    mod = _module_cache.get(mod_path)
+    if mod is None:
+        mod = _module_cache[mod_path] = lazy_import(mod_path)
+    for coin in ch_data.get('coins', []):
+        sym = canonical_symbol(coin.symbol)
+        _pending_handlers.setdefault(sym, []).append((name, mod))
+        _loaded_syms.discard(sym)
+
+
+def _defined_in(obj, mod_path: str) -> bool:
+    """Internal function. Returns ``True`` if the class of ``obj`` was defined within the module ``mod_path``"""
+    m = type(obj).__module__
+    return m == mod_path or m.startswith(mod_path + '.')
@@ -1,15 +1,27 @@
 from os import getenv as env
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 
 from privex.coin_handlers.base.objects import Coin
 
 
+_EMPTY = MappingProxyType({})
+"""Shared (read-only) empty mapping, used as a default for missing settings dicts"""
+
+_MISSING = object()
+"""Sentinel used by :py:meth:`.BaseHandler.find_obj_key` / :py:meth:`.BaseHandler.get_setting` for missing values"""
+
+
 class BaseHandler(ABC):
     allsettings: Dict[str, Any]
+
+    _setting_cache = None  # type: Optional[Dict[Tuple[str, str], Any]]
+    """Resolved :py:meth:`.get_setting` values, mapped by ``(symbol, key)``"""
     
     def __init__(self, *args, settings: Dict[str, dict] = None, **kwargs):
-        self.allsettings = {} if not settings else settings
+        self.allsettings = {} if settings is None else settings
+        self._setting_cache = {}
     
     @classmethod
     def find_obj_key(cls, key: str, obj: Any):
@@ -37,33 +49,88 @@ class BaseHandler(ABC):
         :param Any obj: Any object which supports querying by attribute or item (key)
         :return Any value: The value of the located key/attribute
         """
-        if hasattr(obj, key): return getattr(obj, key)
-        if hasattr(obj, key.lower()): return getattr(obj, key.lower())
-        if hasattr(obj, key.upper()): return getattr(obj, key.upper())
+        k_lower, k_upper = key.lower(), key.upper()
+        # A plain dict's only attributes are it's methods, so skip straight to the key lookups. This also stops keys
+        # such as ``items`` / ``get`` returning a dict method, instead of the value stored under that key.
+        if type(obj) is dict:
+            for k in (key, k_upper, k_lower):
+                if k in obj: return obj[k]
+            raise KeyError(f'Could not find key {key} in object: {obj}')
+
+        # getattr with a default avoids the double lookup of hasattr + getattr
+        for k in (key, k_lower, k_upper):
+            val = getattr(obj, k, _MISSING)
+            if val is not _MISSING: return val
         
-        if key in obj: return obj[key]
-        if key.upper() in obj: return obj[key.upper()]
-        if key.lower() in obj: return obj[key.lower()]
+        for k in (key, k_upper, k_lower):
+            if k in obj: return obj[k]
 
         if isinstance(obj, Coin):
+            # Coin.settings decodes the coin's JSON each time it's accessed, so only access it once
+            c_settings = obj.settings
             try:
-                val = cls.find_obj_key(key=key, obj=obj.settings)
+                val = cls.find_obj_key(key=key, obj=c_settings)
                 return val
             except KeyError:
-                val = cls.find_obj_key(key=key, obj=obj.settings['json'])
+                val = cls.find_obj_key(key=key, obj=c_settings['json'])
                 return val
 
         raise KeyError(f'Could not find key {key} in object: {obj}')
     
     def get_setting(self, symbol: str, key: str, default=None):
-        # First, environment variable settings take precedence if they exist.
-        setting_key = f'COIN_{symbol.upper()}_{key.upper()}'
-        _env = env(setting_key)
+        """
+        Returns the setting ``key`` for the coin ``symbol``, looking in (by order of precedence): the environment
+        variable ``COIN_{SYMBOL}_{KEY}``, the settings dict passed to the constructor, ``self.coin`` and
+        ``self.coins[symbol]``.
+
+        Settings found in the settings dict or the coin(s) are cached per ``(symbol, key)`` - if you change one
+        after it's been read, call :py:meth:`.invalidate_setting` (done for you by
+        :py:func:`privex.coin_handlers.configure_coin`). Environment variables, and settings which weren't found
+        (i.e. ``default`` was returned), are never cached.
+
+        :param str symbol: The coin symbol to look up the setting for
+        :param str key: The name of the setting
+        :param default: The value to return if the setting can't be found
+        :return Any value: The setting value, or ``default``
+        """
+        # Environment variable settings take precedence if they exist.
+        _env = env(f'COIN_{symbol.upper()}_{key.upper()}')
         if _env is not None:
             return _env
 
-        # Next, check the settings dictionary that was passed to the constructor
-        s = self.allsettings.get(symbol.upper(), {})
+        if self._setting_cache is None:
+            self._setting_cache = {}
+        ck = (symbol, key)
+        try:
+            return self._setting_cache[ck]
+        except KeyError:
+            pass
+        val = self._find_setting(symbol, key)
+        if val is _MISSING:
+            return default
+        self._setting_cache[ck] = val
+        return val
+
+    def invalidate_setting(self, symbol: str = None, key: str = None):
+        """
+        Clears cached :py:meth:`.get_setting` values for ``symbol`` / ``key``, or all of them if neither are passed.
+
+        :param str symbol: Only clear the cached settings for this coin symbol
+        :param str key: Only clear the cached settings with this name
+        """
+        if not self._setting_cache:
+            return
+        for sym, k in list(self._setting_cache.keys()):
+            if (symbol is None or sym.upper() == symbol.upper()) and (key is None or k == key):
+                del self._setting_cache[(sym, k)]
+
+    def _find_setting(self, symbol: str, key: str):
+        """
+        Uncached body of :py:meth:`.get_setting`, minus the environment variable lookup - returns
+        :py:attr:`._MISSING` if the setting isn't found
+        """
+        # Check the settings dictionary that was passed to the constructor
+        s = self.allsettings.get(symbol.upper(), _EMPTY)
         if key in s:
             return s[key]
 
@@ -84,8 +151,8 @@ class BaseHandler(ABC):
             except (KeyError, AttributeError):
                 pass
         
-        # Otherwise, we give up and return the ``default``.
-        return default
+        # Otherwise, we give up, and get_setting returns the ``default``.
+        return _MISSING
 
     @property
     def provides(self) -> list:
@@ -56,6 +56,9 @@ class BaseLoader(BaseHandler):
     # provides = ["LTC", "BTC", "BCH"]
     provides: List[str] = []
 
+    log = logging.getLogger(__name__)
+    """Logger for use by loaders - override this in your subclass if you want it to log under it's own name"""
+
     coins: Dict[str, Coin]
     orig_coins: Dict[str, Coin]
     symbols: List[str]
@@ -80,19 +83,22 @@ class BaseLoader(BaseHandler):
 
         coins = [] if not coins else coins
 
-        self.log = logging.getLogger(__name__)
         # List of database symbol IDs (e.g. BTC2, REAL_LTC)
 
         # Pre-load Coin objects, and filter our symbols to only match those that are enabled.
         # self.coins is a dictionary mapping symbols to their Coin objects, for easy lookup.
         # e.g. self.coins['BTC'].display_name
         # Coin objects mapped from their native symbol (e.g. BTC/LTC)
-        self.coins = {c.symbol_id: c for c in coins}    # type: Dict[str, Coin]
+        self.coins = {}         # type: Dict[str, Coin]
         # Coin objects mapped from their database symbol ID (e.g. BTC2, REAL_LTC)
-        self.orig_coins = {c.symbol: c for c in coins}  # type: Dict[str, Coin]
+        self.orig_coins = {}    # type: Dict[str, Coin]
+        # Both dicts are filled in a single pass over the coins
+        for c in coins:
+            self.coins[c.symbol_id] = c
+            self.orig_coins[c.symbol] = c
         # List of native symbols (BTC, LTC, etc.)
-        self.symbols = list(self.coins.keys())
-        self.orig_symbols = list(self.orig_coins.keys())
+        self.symbols = list(self.coins)
+        self.orig_symbols = list(self.orig_coins)
 
         # For your convenience, self.transactions is pre-defined as a list, for loading into by your functions.
         self.transactions = []
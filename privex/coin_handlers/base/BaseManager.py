@@ -43,14 +43,16 @@ class BaseManager(BaseHandler):
     can_issue = False
     """If this manager supports issuing (creating/printing) tokens/coins, set this to True"""
 
+    log = logging.getLogger(__name__)
+    """Logger for use by managers - override this in your subclass if you want it to log under it's own name"""
+
     def __init__(self, settings: Dict[str, dict] = None, coin: Coin = None, *args, **kwargs):
         super().__init__(settings=settings, coin=coin, **kwargs)
-        self.log = logging.getLogger(__name__)
         if not coin:
             raise AttributeError('"coin" must be specified to BaseManager.')
         self.coin = coin
         self.symbol = self.coin.symbol_id.upper()
-        """The native coin symbol, e.g. BTC, LTC, etc. (non-unique)"""
+        """The native coin symbol, e.g. BTC, LTC, etc. (non-unique). Always upper case."""
 
         self.orig_symbol = self.coin.symbol
         """The original unique database symbol ID"""
@@ -193,6 +195,9 @@ class BaseManager(BaseHandler):
         Attempt to send an amount to an address/account, if not enough balance, attempt to issue it instead.
         You may override this method if needed.
 
+        If this manager can issue, our balance is checked before sending, so that we can go straight to issuing
+        instead of having a send fail due to low balance. If the balance check fails, we simply attempt the send.
+
         :param Decimal amount:      Amount of coins/tokens to send/issue, as a Decimal()
         :param address:             Address or account to send/issue the coins/tokens to
         :param memo:                Memo to send/issue coins/tokens with (if supported)
@@ -215,11 +220,22 @@ class BaseManager(BaseHandler):
           }
 
         """
+        kw = dict(amount=amount, address=address, memo=memo, trigger_data=trigger_data)
+        # Skip the (doomed) send attempt if we already know our balance is too low
+        if self.can_issue:
+            try:
+                low_balance = self.balance() < Decimal(amount)
+            except Exception:
+                self.log.warning('Failed to check %s balance before sending, attempting send anyway', self.symbol)
+                low_balance = False
+            if low_balance:
+                return self.issue(**kw)
 
+        # The balance may have changed since we checked it, so we still need to fall back to issuing here.
         try:
-            return self.send(amount=amount, address=address, memo=memo, trigger_data=trigger_data)
+            return self.send(**kw)
         except exceptions.NotEnoughBalance:
-            return self.issue(amount=amount, address=address, memo=memo, trigger_data=trigger_data)
+            return self.issue(**kw)
 
     @abstractmethod
     def __enter__(self):
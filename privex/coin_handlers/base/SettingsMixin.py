@@ -61,7 +61,7 @@ class SettingsMixin(BaseHandler):
     """
 
     def __init__(self, settings: Dict[str, dict], *args, **kwargs):
-        self.allsettings = {} if not settings else settings
+        self.allsettings = {} if settings is None else settings
         super(SettingsMixin, self).__init__(settings=settings, *args, **kwargs)
 
     @property
@@ -73,7 +73,8 @@ class SettingsMixin(BaseHandler):
         :return dict coins: A dict<str,Coin> of supported coins, mapped by symbol
         """
         if hasattr(self, 'coins'):
-            return dict(self.coins)
+            # self.coins is normally already a dict, so avoid making a needless copy of it
+            return self.coins if isinstance(self.coins, dict) else dict(self.coins)
         elif hasattr(self, 'coin'):
             return {self.coin.symbol_id: self.coin}
         raise Exception('Cannot load settings as neither self.coin nor self.coins exists...')
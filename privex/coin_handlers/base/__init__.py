@@ -2,7 +2,7 @@ from privex.coin_handlers.base.BaseLoader import BaseLoader
 from privex.coin_handlers.base.BaseManager import BaseManager
 from privex.coin_handlers.base.BatchLoader import BatchLoader
 from privex.coin_handlers.base.SettingsMixin import SettingsMixin
-from privex.coin_handlers.base.decorators import retry_on_err
+from privex.coin_handlers.base.decorators import retry_on_err, ttl_cache
 import privex.coin_handlers.base.exceptions
 from privex.coin_handlers.base.exceptions import *
 import privex.coin_handlers.base.objects
@@ -1,6 +1,12 @@
 import functools
 import logging
-from time import sleep
+import random
+import threading
+from collections import OrderedDict
+from time import sleep, monotonic
+from typing import Callable
+
+from privex.coin_handlers.base.exceptions import DeadAPIError
 
 DEF_RETRY_MSG = "Exception while running '%s', will retry %d more times."
 DEF_FAIL_MSG = "Giving up after attempting to retry function '%s' %d times."
@@ -45,10 +51,21 @@ def retry_on_err(max_retries: int = 3, delay: int = 3, **retry_conf):
     - (str) fail_msg:  Override the log message used after all retry attempts are exhausted. First message param %s
       is func name, and second param %d is amount of times retried.
 
+    - (list) retry_on: A list() of Exception types which should be retried. If specified, any other exception types
+      are re-raised immediately.
+
+    - (float) backoff: Multiply ``delay`` by this number after each retry, for exponential backoff (Default: 1)
+
+    - (float) jitter:  Add a random amount of up to ``jitter`` seconds to each delay, so that many clients retrying
+      at the same time don't all hit a node at once (Default: 0)
+
     """
     retry_msg = retry_conf['retry_msg'] if 'retry_msg' in retry_conf else DEF_RETRY_MSG
     fail_msg = retry_conf['fail_msg'] if 'fail_msg' in retry_conf else DEF_FAIL_MSG
     fail_on = list(retry_conf['fail_on']) if 'fail_on' in retry_conf else []
+    retry_on = tuple(retry_conf['retry_on']) if 'retry_on' in retry_conf else None
+    backoff = float(retry_conf.get('backoff', 1))
+    jitter = float(retry_conf.get('jitter', 0))
 
     def _decorator(f):
         @functools.wraps(f)
@@ -64,9 +81,14 @@ def retry_on_err(max_retries: int = 3, delay: int = 3, **retry_conf):
                 if type(e) in fail_on:
                     log.warning('Giving up. Re-raising exception %s (as requested by `fail_on` arg)', type(e))
                     raise e
+                if retry_on is not None and not isinstance(e, retry_on):
+                    raise e
                 if retries < max_retries:
-                    log.exception(retry_msg, f.__name__, max_retries - retries)
-                    sleep(delay)
+                    # The traceback is only logged once we give up, rather than for every intermediate retry
+                    log.warning(
+                        retry_msg + ' Reason: %s %s', f.__name__, max_retries - retries, type(e).__name__, str(e)
+                    )
+                    sleep(delay * (backoff ** retries) + (random.uniform(0, jitter) if jitter > 0 else 0))
                     kwargs['retry_attempts'] = retries + 1
                     return wrapper(*args, **kwargs)
                 log.exception(fail_msg, f.__name__, max_retries)
@@ -75,3 +97,100 @@ def retry_on_err(max_retries: int = 3, delay: int = 3, **retry_conf):
     return _decorator
 
 
+def ttl_cache(ttl: float = 300, maxsize: int = 4096, key: Callable = None, cache_if: Callable = None):
+    """
+    Decorates a function or class method, caching it's return value for ``ttl`` seconds, keyed by the arguments it
+    was called with (including ``self`` for methods). Once the cache holds ``maxsize`` results, the least recently
+    used result is evicted.
+
+    Usage (cache the result for each address for up to 5 minutes):
+
+        >>> @ttl_cache(ttl=300)
+        ... def address_valid(self, address) -> bool:
+        ...     return self.rpc.validate_address(address)['valid']
+
+    The wrapped function gains a ``cache_clear()`` method, which empties the cache.
+
+    To share results between instances, pass ``key`` - a function which is called with the same arguments as the
+    decorated function, and returns the (hashable) cache key to use, e.g. ``key=lambda self, addr: (self.symbol, addr)``
+
+    To only cache certain results, pass ``cache_if`` - a function which is called with the return value, and returns
+    ``True`` if it should be cached, e.g. ``cache_if=bool`` to avoid caching ``False`` / empty results.
+
+    :param float ttl:   Number of seconds that a cached result remains valid for
+    :param int maxsize: Maximum number of results to hold in the cache
+    :param callable key: (Optional) Function which generates the cache key from the arguments
+    :param callable cache_if: (Optional) Function which decides whether a return value should be cached
+    """
+    def _decorator(f):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            k = (args, tuple(sorted(kwargs.items()))) if key is None else key(*args, **kwargs)
+            with lock:
+                if k in cache:
+                    ts, res = cache[k]
+                    if monotonic() - ts < ttl:
+                        cache.move_to_end(k)
+                        return res
+                    del cache[k]
+            res = f(*args, **kwargs)
+            if cache_if is not None and not cache_if(res):
+                return res
+            with lock:
+                cache[k] = (monotonic(), res)
+                cache.move_to_end(k)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return res
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return _decorator
+
+
+class CircuitBreaker:
+    """
+    A simple circuit breaker, which tracks consecutive failures per key (e.g. a ``(host, port)`` tuple for an RPC node).
+
+    Once a key has failed ``threshold`` times in a row, :py:meth:`.check` will raise :class:`.DeadAPIError` for that
+    key until ``cooldown`` seconds have passed since it's last failure, so that we stop hammering a dead node.
+
+        >>> breaker = CircuitBreaker(threshold=5, cooldown=30)
+        >>> breaker.check(('127.0.0.1', 18082))    # Raises DeadAPIError if the node is considered dead
+        >>> try:
+        ...     do_some_rpc_call()
+        ...     breaker.success(('127.0.0.1', 18082))
+        ... except ConnectionError:
+        ...     breaker.failure(('127.0.0.1', 18082))
+        ...     raise
+
+    """
+    def __init__(self, threshold: int = 5, cooldown: float = 30):
+        self.threshold, self.cooldown = int(threshold), float(cooldown)
+        self._fails = {}       # Maps each key to it's number of consecutive failures
+        self._last_fail = {}   # Maps each key to the monotonic time of it's last failure
+        self._lock = threading.Lock()
+
+    def check(self, key):
+        """Raises :class:`.DeadAPIError` if the circuit for ``key`` is open (too many recent failures)"""
+        with self._lock:
+            if self._fails.get(key, 0) < self.threshold:
+                return
+            if monotonic() - self._last_fail.get(key, 0) >= self.cooldown:
+                # The cooldown has passed - allow another attempt. If it fails, the circuit will open again.
+                self._fails[key] = self.threshold - 1
+                return
+        raise DeadAPIError(f'{key} has failed {self.threshold} or more times in a row. Not retrying for now.')
+
+    def success(self, key):
+        with self._lock:
+            self._fails.pop(key, None)
+            self._last_fail.pop(key, None)
+
+    def failure(self, key):
+        with self._lock:
+            self._fails[key] = self._fails.get(key, 0) + 1
+            self._last_fail[key] = monotonic()
@@ -1,7 +1,8 @@
 import json
+import sys
 import attr
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List
 
@@ -11,14 +12,43 @@ from privex.helpers import is_true
 log = logging.getLogger(__name__)
 
 
+_MISSING = object()
+"""Sentinel used by ``__getitem__`` to detect missing attributes"""
+
+_HAS_ISOFORMAT = hasattr(datetime, 'fromisoformat')
+"""``datetime.fromisoformat`` only exists on Python 3.7+ - on 3.6, :func:`.convert_datetime` always uses dateutil"""
+
+
 def convert_datetime(d):
-    if type(d) in [str, int]:
-        d = parse(d)
+    """
+    Converts ``d`` into a :class:`datetime.datetime` - ``d`` may be a datetime, an ISO8601 string, or an integer
+    UNIX timestamp (which is assumed to be UTC).
+
+    Strings are parsed with :meth:`datetime.fromisoformat` where available, as it's much faster than dateutil's
+    :func:`.parse` - which is only used for strings that ``fromisoformat`` can't handle.
+    """
+    if type(d) is datetime:
+        return d
+    if type(d) is str:
+        try:
+            d = datetime.fromisoformat(d[:-1] + '+00:00' if d.endswith('Z') else d) if _HAS_ISOFORMAT else parse(d)
+        except ValueError:
+            d = parse(d)
+    elif type(d) is int:
+        d = datetime.fromtimestamp(d, tz=timezone.utc)
     if type(d) is not datetime:
         raise ValueError('Timestamp must be either a datetime object, or an ISO8601 string...')
     return d
 
 
+def intern_str(s):
+    """
+    Interns ``s`` via :func:`sys.intern` if it's a string, so that the many dict lookups keyed by coin symbols can
+    short-circuit on identity. Non-string values (e.g. ``None``) are returned as-is.
+    """
+    return sys.intern(s) if type(s) is str else s
+
+
 class DictLike(object):
     """
     Allows child classes to work like ``dict``'s
@@ -41,9 +71,11 @@ class DictLike(object):
         When the instance is accessed like a dict, try returning the matching attribute.
         If the attribute doesn't exist, or the key is an integer, try and pull it from raw_data
         """
-        if hasattr(self, key):
-            return getattr(self, key)
-        raise KeyError(key)
+        # getattr with a default avoids looking the attribute up twice (hasattr + getattr)
+        val = getattr(self, key, _MISSING)
+        if val is _MISSING:
+            raise KeyError(key)
+        return val
 
     def __setitem__(self, key, value):
         return setattr(self, key, value)
@@ -51,25 +83,31 @@ class DictLike(object):
 
 @attr.s
 class AttribDictable:
+    # An empty __slots__ allows slotted subclasses (e.g. Deposit) to avoid having a per-instance __dict__, while
+    # non-slotted subclasses such as Coin still get one as normal.
+    __slots__ = ()
+
     def get(self, key, default=None):
-        try:
-            return self[key]
-        except KeyError:
-            return default
+        # Avoids raising (and catching) a KeyError from __getitem__ for every missing key
+        val = getattr(self, key, _MISSING)
+        return default if val is _MISSING else val
     
     def __iter__(self):
         """Handle casting via ``dict(myclass)``"""
-        for k, v in attr.asdict(self).items():
-            yield k, v
+        # Walk the fields directly, rather than having attr.asdict() build (and recursively copy into) a new dict
+        for f in attr.fields(type(self)):
+            yield f.name, getattr(self, f.name)
 
     def __getitem__(self, key):
         """
         When the instance is accessed like a dict, try returning the matching attribute.
         If the attribute doesn't exist, or the key is an integer, try and pull it from raw_data
         """
-        if hasattr(self, key):
-            return getattr(self, key)
-        raise KeyError(key)
+        # getattr with a default avoids looking the attribute up twice (hasattr + getattr)
+        val = getattr(self, key, _MISSING)
+        if val is _MISSING:
+            raise KeyError(key)
+        return val
 
     def __setitem__(self, key, value):
         return setattr(self, key, value)
@@ -98,8 +136,8 @@ class Coin(AttribDictable):
         'display_name',
     ]
     
-    symbol = attr.ib(type=str)
-    symbol_id = attr.ib(type=str)
+    symbol = attr.ib(type=str, converter=intern_str)
+    symbol_id = attr.ib(type=str, converter=intern_str)
     coin_type = attr.ib(default=None, type=str)
     our_account = attr.ib(default=None, type=str)
     can_issue = attr.ib(default=False, type=bool)
@@ -129,27 +167,38 @@ class Coin(AttribDictable):
         Small helper property for quickly accessing the setting_xxxx fields, while also decoding the custom json
         field into a dictionary/list
 
+        The decoded ``json`` is cached until ``setting_json`` is re-assigned, so it's shared between the dicts
+        returned by each access, and shouldn't be modified.
+
         :return: dict(host:str, port:str, user:str, password:str, json:dict/list)
         """
-        try:
-            j = json.loads(self.setting_json)
-        except:
-            log.exception("Couldn't decode JSON for coin %s, falling back to {}", str(self))
-            j = {}
+        sj = self.setting_json
+        cached = self.__dict__.get('_json_cache')
+        # The cache holds a reference to the string it was decoded from, so an identity check is enough
+        if cached is None or cached[0] is not sj:
+            try:
+                j = json.loads(sj)
+            except:
+                log.exception("Couldn't decode JSON for coin %s, falling back to {}", str(self))
+                j = {}
+            cached = self.__dict__['_json_cache'] = (sj, j)
 
         return dict(
             host=self.setting_host,
             port=self.setting_port,
             user=self.setting_user,
             password=self.setting_pass,
-            json=j
+            json=cached[1]
         )
 
 
-@attr.s
+@attr.s(slots=True)
 class Deposit(AttribDictable):
     """
     Represents a generic Deposit on any coin
+
+    Loaders can create a large number of these, so their fields are stored in ``__slots__`` rather than in a
+    per-instance ``__dict__``.
     """
 
     dict_keys = {'coin', 'tx_timestamp', 'amount', 'txid', 'vout', 'address', 'memo', 'from_account', 'to_account'}
@@ -2,7 +2,14 @@
 This file exists to allow for ``python3 -m tests`` to work, as python's module execution option
 attempts to load ``__main__`` from a package.
 """
-from tests import *
+import unittest
+from tests.test_bitcoin import *
+from tests.test_decorators import *
+from tests.test_golos import *
+from tests.test_keystore import *
+from tests.test_main import *
+from tests.test_monero import *
+from tests.test_objects import *
 
 if __name__ == '__main__':
     unittest.main()
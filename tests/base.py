@@ -1,6 +1,18 @@
+import atexit
+import os
+import signal
+import socket
+from time import sleep, perf_counter
+from typing import Optional
+
+from privex.rpcemulator.bitcoin import BitcoinEmulator
+
 from privex import coin_handlers as ch
 from privex.coin_handlers import Coin
 
+_bitcoin_emulator = None   # type: Optional[BitcoinEmulator]
+_bitcoin_port = None       # type: Optional[int]
+
 
 def clear_handler(name: str):
     ch.COIN_HANDLERS[name] = dict(enabled=False, coins=[], kwargs={})
@@ -9,7 +21,9 @@ def clear_handler(name: str):
 
 def clear_handler_settings(symbol: str = None):
     if not symbol:
-        ch.HANDLER_SETTINGS['COIND_RPC'] = dict(BTC={})
+        # Once the shared emulator is running, the BTC handler must keep pointing at it's (ephemeral) port
+        btc = {} if _bitcoin_port is None else dict(host='127.0.0.1', port=_bitcoin_port)
+        ch.HANDLER_SETTINGS['COIND_RPC'] = dict(BTC=btc)
         return
     if symbol in ch.HANDLER_SETTINGS['COIND_RPC']:
         ch.HANDLER_SETTINGS['COIND_RPC'][symbol] = {}
@@ -24,3 +38,66 @@ def setup_handler(name: str, symbol: str = 'EXTESTCOIN', enabled: bool = True):
     coin = Coin(symbol=symbol)
     ch.add_handler_coin(name, coin)
     ch.reload_handlers()
+
+
+def get_bitcoin_emulator() -> BitcoinEmulator:
+    """
+    Returns a :class:`.BitcoinEmulator` which is shared by all tests, so the emulator process only has to be started
+    once per test run. It's started on the first call (on a free ephemeral port), and terminated at exit.
+
+    Call :func:`.clear_handler_settings` after this, so that the ``BTC`` handler settings point at the emulator's port.
+
+    :raises RuntimeError: The emulator wasn't accepting connections before :func:`.wait_rpc_ready`'s deadline
+    """
+    global _bitcoin_emulator, _bitcoin_port
+    if _bitcoin_emulator is None:
+        _bitcoin_port = free_port()
+        _bitcoin_emulator = BitcoinEmulator(port=_bitcoin_port)
+        atexit.register(stop_emulator, _bitcoin_emulator)
+        if not wait_rpc_ready(port=_bitcoin_port):
+            raise RuntimeError(f'BitcoinEmulator did not start accepting connections on port {_bitcoin_port}')
+    return _bitcoin_emulator
+
+
+def free_port(host: str = '127.0.0.1') -> int:
+    """
+    Ask the OS for a currently unused TCP port on ``host``, so that emulators in separate test processes
+    (e.g. test files being run in parallel) don't fight over the same port.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+def stop_emulator(emulator, timeout: float = 2.0):
+    """
+    Terminate an RPC emulator's process, and wait (up to ``timeout`` seconds) for it to exit, so that it's port is
+    freed. If it hasn't exited by then, it's killed.
+    """
+    proc = emulator.proc
+    if proc is None:
+        return
+    emulator.terminate()
+    proc.join(timeout)
+    if proc.is_alive():
+        # Process.kill() is only available on py3.7+, so send SIGKILL ourselves (SIGTERM on platforms without it)
+        os.kill(proc.pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        proc.join(1.0)
+
+
+def wait_rpc_ready(host: str = '127.0.0.1', port: int = 8332, deadline: float = 2.0) -> bool:
+    """
+    Wait until something is accepting connections on ``host``:``port`` (e.g. an RPC emulator which was just
+    launched), retrying with a short exponential backoff, for up to ``deadline`` seconds.
+
+    :return bool ready: ``True`` if the port accepted a connection, ``False`` if ``deadline`` was reached
+    """
+    end, attempt = perf_counter() + deadline, 0
+    while perf_counter() < end:
+        try:
+            socket.create_connection((host, port), timeout=0.02).close()
+            return True
+        except OSError:
+            sleep(min(0.01 * (1.5 ** attempt), 0.05))
+            attempt += 1
+    return False
@@ -1,13 +1,12 @@
 import unittest
 from datetime import datetime
 from decimal import Decimal
-from time import sleep
 
 import privex.coin_handlers as ch
 from privex.rpcemulator.bitcoin import BitcoinEmulator
 
 from privex.coin_handlers.base import AccountNotFound, NotEnoughBalance
-from tests.base import clear_handler, clear_handler_settings, setup_handler
+from tests.base import clear_handler, clear_handler_settings, setup_handler, get_bitcoin_emulator
 
 
 class TestBitcoinHandlerEmulated(unittest.TestCase):
@@ -16,9 +15,8 @@ class TestBitcoinHandlerEmulated(unittest.TestCase):
     
     @classmethod
     def setUpClass(cls) -> None:
-        """Launch the Bitcoin RPC emulator in the background on default port 8332"""
-        cls.emulator = BitcoinEmulator()
-        sleep(1)
+        """Launch (or re-use) the shared Bitcoin RPC emulator in the background on a free port"""
+        cls.emulator = get_bitcoin_emulator()
         clear_handler_settings()
         clear_handler('Bitcoin')
 
@@ -26,9 +24,7 @@ class TestBitcoinHandlerEmulated(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls) -> None:
-        """Shutdown the Bitcoin RPC emulator process"""
-        cls.emulator.terminate()
-        sleep(1)
+        """Reset the Bitcoin handler. The shared emulator process is left running, and is shutdown at exit."""
         clear_handler_settings()
         clear_handler('Bitcoin')
     
@@ -0,0 +1,135 @@
+import unittest
+from unittest import mock
+
+from privex.coin_handlers.base import decorators
+from privex.coin_handlers.base.decorators import retry_on_err, CircuitBreaker, ttl_cache
+from privex.coin_handlers.base.exceptions import DeadAPIError
+
+
+class TestRetryOnErr(unittest.TestCase):
+    def setUp(self) -> None:
+        # Record the delays retry_on_err would sleep for, without actually sleeping
+        patcher = mock.patch.object(decorators, 'sleep')
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _failing(self, exc, fail_times=99, **conf):
+        calls = []
+
+        @retry_on_err(**conf)
+        def f():
+            calls.append(1)
+            if len(calls) <= fail_times:
+                raise exc
+            return 'ok'
+        return f, calls
+
+    def test_retries_then_succeeds(self):
+        f, calls = self._failing(ConnectionError(), fail_times=2, max_retries=3, delay=1)
+        self.assertEqual(f(), 'ok')
+        self.assertEqual(len(calls), 3)
+
+    def test_gives_up(self):
+        f, calls = self._failing(ConnectionError(), max_retries=3, delay=1)
+        with self.assertRaises(ConnectionError):
+            f()
+        self.assertEqual(len(calls), 4)
+
+    def test_retry_on(self):
+        """Exceptions which aren't in ``retry_on`` are raised immediately"""
+        f, calls = self._failing(ValueError(), max_retries=3, delay=1, retry_on=[ConnectionError])
+        with self.assertRaises(ValueError):
+            f()
+        self.assertEqual(len(calls), 1)
+        f, calls = self._failing(ConnectionError(), fail_times=1, max_retries=3, delay=1, retry_on=[ConnectionError])
+        self.assertEqual(f(), 'ok')
+        self.assertEqual(len(calls), 2)
+
+    def test_backoff(self):
+        f, _ = self._failing(ConnectionError(), max_retries=3, delay=0.5, backoff=2)
+        with self.assertRaises(ConnectionError):
+            f()
+        self.assertEqual([c[0][0] for c in self.sleep.call_args_list], [0.5, 1.0, 2.0])
+
+    def test_jitter(self):
+        f, _ = self._failing(ConnectionError(), max_retries=20, delay=1, jitter=0.25)
+        with self.assertRaises(ConnectionError):
+            f()
+        delays = [c[0][0] for c in self.sleep.call_args_list]
+        self.assertEqual(len(delays), 20)
+        for d in delays:
+            self.assertGreaterEqual(d, 1)
+            self.assertLessEqual(d, 1.25)
+        self.assertGreater(len(set(delays)), 1)
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_cache_if(self):
+        """Results rejected by ``cache_if`` aren't cached, so the function is called again"""
+        calls = []
+
+        @ttl_cache(ttl=300, cache_if=bool)
+        def exists(name):
+            calls.append(name)
+            return name == 'alice'
+
+        self.assertTrue(exists('alice'))
+        self.assertTrue(exists('alice'))
+        self.assertFalse(exists('bob'))
+        self.assertFalse(exists('bob'))
+        self.assertEqual(calls, ['alice', 'bob', 'bob'])
+
+    def test_key(self):
+        """Instances producing the same ``key`` share cached results"""
+        calls = []
+
+        class Mgr:
+            def __init__(self, symbol):
+                self.symbol = symbol
+
+            @ttl_cache(ttl=300, key=lambda self, address: (self.symbol, address))
+            def valid(self, address):
+                calls.append((self.symbol, address))
+                return True
+
+        Mgr('GOLOS').valid('alice')
+        Mgr('GOLOS').valid('alice')
+        Mgr('GBG').valid('alice')
+        self.assertEqual(calls, [('GOLOS', 'alice'), ('GBG', 'alice')])
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    key = ('127.0.0.1', 18082)
+
+    def test_trips_after_threshold(self):
+        b = CircuitBreaker(threshold=3, cooldown=30)
+        for _ in range(2):
+            b.failure(self.key)
+        b.check(self.key)
+        b.failure(self.key)
+        with self.assertRaises(DeadAPIError):
+            b.check(self.key)
+        # Other keys aren't affected
+        b.check(('127.0.0.1', 18083))
+
+    def test_success_resets(self):
+        b = CircuitBreaker(threshold=2, cooldown=30)
+        b.failure(self.key)
+        b.success(self.key)
+        b.failure(self.key)
+        b.check(self.key)
+
+    def test_cooldown(self):
+        b = CircuitBreaker(threshold=2, cooldown=30)
+        with mock.patch.object(decorators, 'monotonic', return_value=1000.0):
+            b.failure(self.key)
+            b.failure(self.key)
+            with self.assertRaises(DeadAPIError):
+                b.check(self.key)
+        with mock.patch.object(decorators, 'monotonic', return_value=1031.0):
+            # Once the cooldown has passed, a single attempt is allowed through...
+            b.check(self.key)
+            # ...but if it fails, the circuit opens straight away again.
+            b.failure(self.key)
+            with self.assertRaises(DeadAPIError):
+                b.check(self.key)
@@ -0,0 +1,158 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from privex.coin_handlers.KeyStore import MemoryKeyStore, get_key_store, set_key_store
+from privex.coin_handlers.base.exceptions import AccountNotFound, NotEnoughBalance
+from privex.coin_handlers.base.objects import Coin
+from privex.coin_handlers.Golos.GolosLoader import GolosLoader
+from privex.coin_handlers.Golos.GolosManager import GolosManager
+from privex.coin_handlers.Golos.GolosMixin import LockedApi
+
+
+class StubGolosApi:
+    """A stand-in for :class:`golos.Api` which never touches the network, and records each RPC call made to it"""
+    asset_precision = {'GOLOS': 3, 'GBG': 3}
+
+    class rpc:
+        url = 'wss://golos.example.com'
+
+    def __init__(self, balances: dict, history: dict = None):
+        self.balances = balances
+        self.history = {} if history is None else history
+        self.calls = []
+
+    def get_accounts(self, names: list) -> list:
+        self.calls.append(('get_accounts', names))
+        return [dict(name=n, GOLOS=str(self.balances[n])) for n in names if n in self.balances]
+
+    def get_dynamic_global_properties(self) -> dict:
+        return dict(head_block_number=1234, time='2019-06-01T12:30:00')
+
+    def get_config(self) -> dict:
+        return dict(STEEMIT_BLOCKCHAIN_VERSION='0.18.4')
+
+    def transfer(self, **kwargs) -> dict:
+        self.calls.append(('transfer', kwargs))
+        return dict(id='abcdef')
+
+    def get_account_history(self, account: str) -> list:
+        self.calls.append(('get_account_history', account))
+        return list(self.history.get(account, []))
+
+    def methods(self):
+        return [c[0] for c in self.calls]
+
+
+class TestGolosManager(unittest.TestCase):
+    def setUp(self) -> None:
+        GolosManager._chain_version.cache_clear()
+        GolosManager.address_valid.cache_clear()
+        self.api = StubGolosApi(balances=dict(sender=Decimal('10'), receiver=Decimal('0')))
+        self.mgr = GolosManager(settings={}, coin=Coin(symbol='GOLOS', our_account='sender'))
+        self.mgr._rpc = self.api
+        set_key_store(MemoryKeyStore())
+        get_key_store().set(network='golos', account='sender', key_type='active', private_key='5Jxxxx')
+
+    def test_send(self):
+        res = self.mgr.send(amount=Decimal('1.2345'), address='receiver')
+        self.assertEqual(res['amount'], Decimal('1.234'))
+        self.assertEqual(res['txid'], 'abcdef')
+        self.assertEqual(res['from'], 'sender')
+        # Both accounts and the sender's balance are loaded using a single get_accounts call
+        self.assertEqual(self.api.calls[0], ('get_accounts', ['receiver', 'sender']))
+        self.assertEqual(self.api.methods(), ['get_accounts', 'transfer'])
+
+    def test_send_missing_destination(self):
+        with self.assertRaises(AccountNotFound):
+            self.mgr.send(amount=Decimal('1'), address='nobody')
+        self.assertNotIn('transfer', self.api.methods())
+
+    def test_send_missing_sender(self):
+        with self.assertRaises(AccountNotFound):
+            self.mgr.send(amount=Decimal('1'), address='receiver', from_address='nobody')
+        self.assertNotIn('transfer', self.api.methods())
+
+    def test_send_low_balance(self):
+        with self.assertRaises(NotEnoughBalance):
+            self.mgr.send(amount=Decimal('10.001'), address='receiver')
+        self.assertNotIn('transfer', self.api.methods())
+
+    def test_send_below_min_amount(self):
+        with self.assertRaises(ArithmeticError):
+            self.mgr.send(amount=Decimal('0.0009'), address='receiver')
+        self.assertNotIn('transfer', self.api.methods())
+
+    def test_health(self):
+        """Test health() checks our account and loads it's balance with a single get_accounts call"""
+        _, _, data = self.mgr.health()
+        self.assertIn('Okay', data[1])
+        self.assertEqual(data[7], 'sender')
+        self.assertEqual(data[8], '10.000')
+        self.assertEqual(self.api.methods(), ['get_accounts'])
+
+    def test_health_missing_account(self):
+        self.mgr.coin.our_account = self.mgr._our_account = 'nobody'
+        _, _, data = self.mgr.health()
+        self.assertIn('Account nobody not found', data[1])
+        self.assertEqual(data[8], '')
+
+
+def _history_tx(trx_id, frm, to, amount, type_op='transfer'):
+    return dict(
+        type_op=type_op, trx_id=trx_id, to=to, memo=' hello ', timestamp='2019-06-01T12:30:00', amount=amount,
+        **{'from': frm}
+    )
+
+
+class TestGolosLoader(unittest.TestCase):
+    def test_list_txs(self):
+        """Test list_txs fetches each symbol's history from a shared Api one at a time, and only yields deposits"""
+        api = StubGolosApi(balances={}, history=dict(
+            golosacc=[
+                _history_tx('tx1', 'someone', 'golosacc', '1.500 GOLOS'),
+                _history_tx('tx2', 'golosacc', 'someone', '2.000 GOLOS'),        # Outgoing
+                _history_tx('tx3', 'someone', 'golosacc', '0.100 GBG'),          # Wrong symbol
+                _history_tx('tx4', 'someone', 'golosacc', '1.000 GOLOS', 'vote'),
+            ],
+            gbgacc=[_history_tx('tx5', 'someone', 'gbgacc', '3.250 GBG')],
+        ))
+        loader = GolosLoader(settings={}, coins=[
+            Coin(symbol='GOLOS', our_account='golosacc'), Coin(symbol='GBG', our_account='gbgacc'),
+        ])
+        loader._rpcs = dict(GOLOS=api, GBG=api)
+        txs = sorted(loader.list_txs(), key=lambda d: d.txid)
+        self.assertEqual([(d.txid, d.coin, d.amount) for d in txs], [
+            ('tx1', 'GOLOS', Decimal('1.5')), ('tx5', 'GBG', Decimal('3.25')),
+        ])
+        self.assertEqual(txs[0].memo, 'hello')
+        self.assertEqual(txs[0].from_account, 'someone')
+        self.assertEqual(sorted(api.calls), [('get_account_history', 'gbgacc'), ('get_account_history', 'golosacc')])
+
+
+class TestLockedApi(unittest.TestCase):
+    def test_calls_serialised(self):
+        """Test calls from several threads through a LockedApi are made one at a time"""
+        class SlowApi:
+            url = 'wss://golos.example.com'
+
+            def __init__(self):
+                self.active = self.max_active = 0
+                self.counter_lock = threading.Lock()
+
+            def get_accounts(self, names):
+                with self.counter_lock:
+                    self.active += 1
+                    self.max_active = max(self.max_active, self.active)
+                threading.Event().wait(0.01)
+                with self.counter_lock:
+                    self.active -= 1
+                return names
+
+        api = LockedApi(SlowApi())
+        self.assertEqual(api.url, 'wss://golos.example.com')
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            res = list(ex.map(lambda n: api.get_accounts([n]), range(8)))
+        self.assertEqual(res, [[n] for n in range(8)])
+        self.assertEqual(api.api.max_active, 1)
@@ -0,0 +1,47 @@
+import unittest
+
+from privex.coin_handlers.KeyStore import MemoryKeyStore
+
+
+class TestMemoryKeyStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ks = ks = MemoryKeyStore()
+        self.k1 = ks.set(network='golos', private_key='priv1', account='alice', key_type='active')
+        self.k2 = ks.set(network='golos', private_key='priv2', account='alice', key_type='memo')
+        self.k3 = ks.set(network='steem', private_key='priv3', account='alice', key_type='active')
+        self.k4 = ks.set(network='golos', private_key='priv4', account='bob', key_type='active')
+
+    def test_get_id(self):
+        """Test get(id=x) returns the KeyPair with that ``id`` (ids start at 1), not the one at list position x"""
+        self.assertEqual(self.k1.id, 1)
+        self.assertIs(self.ks.get(id=1), self.k1)
+        self.assertIs(self.ks.get(id='3'), self.k3)
+        self.assertIsNone(self.ks.get(id=99))
+        # Other filters still apply on top of the id
+        self.assertIsNone(self.ks.get(id=1, network='steem'))
+
+    def test_get_account(self):
+        self.assertIs(self.ks.get(account='alice'), self.k1)
+        self.assertIs(self.ks.get(account='bob'), self.k4)
+        self.assertIs(self.ks.get(account='alice', network='steem'), self.k3)
+        self.assertIsNone(self.ks.get(account='carol'))
+
+    def test_get_network_account_type(self):
+        self.assertIs(self.ks.get(network='golos', account='alice', key_type='memo'), self.k2)
+        self.assertIs(self.ks.get(network='steem', account='alice', key_type='active'), self.k3)
+        self.assertIsNone(self.ks.get(network='steem', account='alice', key_type='memo'))
+
+    def test_get_key_type_in(self):
+        self.assertIs(self.ks.get(network='golos', account='alice', key_type__in=['memo', 'posting']), self.k2)
+        self.assertIs(self.ks.get(network='golos', account='alice', key_type__in=['memo', 'active']), self.k1)
+        self.assertIsNone(self.ks.get(network='golos', account='bob', key_type__in=['memo']))
+
+    def test_set_reindexes(self):
+        """Test updating a KeyPair with set(id=x) updates the indexes used by get()"""
+        k = self.ks.set(id=2, account='carol', key_type='active')
+        self.assertIs(k, self.k2)
+        self.assertEqual(k.private_key, 'priv2')
+        self.assertIs(self.ks.get(account='carol'), self.k2)
+        self.assertIs(self.ks.get(network='golos', account='carol', key_type='active'), self.k2)
+        self.assertIsNone(self.ks.get(network='golos', account='alice', key_type='memo'))
+        self.assertIs(self.ks.get(id=2), self.k2)
@@ -1,8 +1,23 @@
+import os
+import subprocess
+import sys
+import types
 import unittest
+from unittest import mock
+from decimal import Decimal
 import privex.coin_handlers as ch
+from privex.coin_handlers.base import exceptions
+from privex.coin_handlers.base.BaseManager import BaseManager
 from privex.coin_handlers.base.objects import Coin
 from tests.base import clear_handler, clear_handler_settings, setup_handler
 
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_isolated(code: str) -> list:
+    """Run ``code`` in a fresh python interpreter (so that it has clean ``sys.modules``), returning it's output lines"""
+    return subprocess.check_output([sys.executable, '-c', code], cwd=BASE_DIR).decode().splitlines()
+
 
 class TestHandlerMain(unittest.TestCase):
     @classmethod
@@ -57,6 +72,51 @@ class TestHandlerMain(unittest.TestCase):
         self.assertDictEqual(c_btc['kwargs'], {'example': 'hello'})
         self.assertEqual(c_btc['testing'], 1)
 
+    def test_configure_coin_invalidates_setting(self):
+        """Test configure_coin clears the cached get_setting values of already loaded handlers"""
+        coin = ch.COIN_MAP['BTC']
+        self.addCleanup(setattr, coin, 'our_account', coin.our_account)
+        ch.add_handler_coin('Bitcoin', 'BTC')
+        ch.reload_handlers()
+        mgr = ch.get_manager('BTC')
+        ch.configure_coin('BTC', our_account='first')
+        self.assertEqual(mgr.get_setting('BTC', 'our_account'), 'first')
+        ch.configure_coin('BTC', our_account='second')
+        self.assertEqual(mgr.get_setting('BTC', 'our_account'), 'second')
+
+    def test_bitcoin_settings_inplace(self):
+        """Test in-place edits to COIND_RPC are picked up by already loaded Bitcoin handlers"""
+        ch.add_handler_coin('Bitcoin', 'BTC')
+        ch.reload_handlers()
+        mgr = ch.get_manager('BTC')
+        ch.HANDLER_SETTINGS['COIND_RPC']['BTC']['port'] = 18332
+        self.assertEqual(mgr.settings['BTC']['port'], 18332)
+        ch.HANDLER_SETTINGS['COIND_RPC']['BTC']['port'] = 28332
+        self.assertEqual(mgr.settings['BTC']['port'], 28332)
+
+    def test_get_setting_edited(self):
+        """Test settings which were missing, or came from the environment, are re-read rather than cached"""
+        ch.add_handler_coin('Bitcoin', 'BTC')
+        ch.reload_handlers()
+        mgr = ch.get_manager('BTC')
+        self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'default')
+        mgr.allsettings = dict(BTC=dict(example_key='found'))
+        self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'found')
+        with mock.patch.dict(os.environ, COIN_BTC_EXAMPLE_KEY='from_env'):
+            self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'from_env')
+        self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'found')
+
+    def test_invalidate_setting(self):
+        """Test a cached get_setting value is cleared by invalidate_setting"""
+        ch.add_handler_coin('Bitcoin', 'BTC')
+        ch.reload_handlers()
+        mgr = ch.get_manager('BTC')
+        mgr.allsettings = dict(BTC=dict(example_key='found'))
+        self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'found')
+        mgr.allsettings['BTC']['example_key'] = 'edited'
+        mgr.invalidate_setting('btc', 'example_key')
+        self.assertEqual(mgr.get_setting('BTC', 'example_key', 'default'), 'edited')
+
     def test_configure_handler_nonexistent(self):
         with self.assertRaises(KeyError):
             ch.configure_handler('ThisDoesNotExist', hello='world')
@@ -92,3 +152,195 @@ class TestHandlerMain(unittest.TestCase):
 
 
 
+    def test_reload_handler(self):
+        """Test reload_handler only rebuilds the given handler, leaving other handlers' instances untouched"""
+        golos = ch.COIN_HANDLERS['Golos']
+        self.addCleanup(ch.COIN_HANDLERS.__setitem__, 'Golos', dict(golos, coins=list(golos['coins'])))
+        ch.add_handler_coin('Bitcoin', Coin(symbol='TESTCOIN'))
+        ch.add_handler_coin('Golos', Coin(symbol='TESTGOLOS', our_account='someone'))
+        ch.enable_handler('Bitcoin', 'Golos')
+        ch.reload_handlers()
+        btc_loader, golos_loader = ch.get_loader('TESTCOIN'), ch.get_loader('TESTGOLOS')
+        golos_manager = ch.get_manager('TESTGOLOS')
+
+        ch.add_handler_coin('Bitcoin', Coin(symbol='TESTCOIN2'))
+        ch.reload_handler('Bitcoin')
+        self.assertIsNot(ch.get_loader('TESTCOIN'), btc_loader)
+        self.assertTrue(ch.has_loader('TESTCOIN2'))
+        self.assertIs(ch.get_loader('TESTGOLOS'), golos_loader)
+        self.assertIs(ch.get_manager('TESTGOLOS'), golos_manager)
+
+        ch.disable_handler('Bitcoin')
+        ch.reload_handler('Bitcoin')
+        self.assertFalse(ch.has_loader('TESTCOIN'))
+        self.assertIs(ch.get_loader('TESTGOLOS'), golos_loader)
+
+    def test_handler_constructor_error(self):
+        """Test a handler whose manager fails to construct raises, isn't left half registered, and is retried"""
+        class GoodLoader:
+            def __init__(self, settings=None, coins=None, **kwargs):
+                self.coins = coins
+
+        class BrokenManager:
+            def __init__(self, settings=None, coin=None, **kwargs):
+                raise RuntimeError('manager construction failed')
+
+        mod_path = f'{ch.CH_BASE}.BrokenTestHandler'
+        mod = types.ModuleType(mod_path)
+        mod.exports = dict(loader=GoodLoader, manager=BrokenManager)
+        sys.modules[mod_path] = mod
+        self.addCleanup(ch.reload_handlers)
+        self.addCleanup(ch._module_cache.pop, mod_path, None)
+        self.addCleanup(sys.modules.pop, mod_path, None)
+        self.addCleanup(ch.COIN_HANDLERS.pop, 'BrokenTestHandler', None)
+        ch.COIN_HANDLERS['BrokenTestHandler'] = dict(enabled=True, coins=[Coin(symbol='BRKN')])
+        ch.add_handler_coin('Bitcoin', Coin(symbol='TESTCOIN'))
+        ch.enable_handler('Bitcoin')
+        ch.reload_handlers()
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                ch.get_manager('BRKN')
+            # The loader which did construct successfully must have been removed again
+            self.assertEqual(ch.handlers.get('BRKN', {}).get('loaders', []), [])
+            self.assertNotIn('BrokenTestHandler', ch._loaded_handlers)
+        # The broken handler shouldn't stop the other handlers from being listed
+        loaders = dict(ch.get_loaders())
+        self.assertEqual(len(loaders['TESTCOIN']), 1)
+
+    def test_manager_kept_on_unchanged_reload(self):
+        """Test reload_handlers() keeps the existing handler instances when the config hasn't changed"""
+        ch.add_handler_coin('Bitcoin', 'BTC')
+        ch.reload_handlers()
+        mgr, loader = ch.get_manager('BTC'), ch.get_loader('BTC')
+        ch.reload_handlers()
+        self.assertIs(ch.get_manager('BTC'), mgr)
+        self.assertIs(ch.get_loader('BTC'), loader)
+
+    def test_lazy_handler_imports(self):
+        """Test importing privex.coin_handlers doesn't import any handler modules until their classes are accessed"""
+        out = _run_isolated(
+            "import sys\n"
+            "import privex.coin_handlers as ch\n"
+            "loaded = lambda: sorted({m.split('.')[2] for m in sys.modules if m.startswith('privex.coin_handlers.')}\n"
+            "                        & {'Bitcoin', 'Golos', 'Monero'} | {'golos'} & set(sys.modules))\n"
+            "print(loaded())\n"
+            "ch.MoneroManager\n"
+            "print(loaded())\n"
+        )
+        self.assertEqual(out, ["[]", "['Monero']"])
+
+    def test_eager_imports_before_py37(self):
+        """Test the handler classes are imported up-front on Python versions without module __getattr__"""
+        out = _run_isolated(
+            "import sys\n"
+            "sys.version_info = (3, 6, 9)\n"
+            "import privex.coin_handlers as ch\n"
+            "print(all(k in vars(ch) for k in ch._LAZY_EXPORTS), 'privex.coin_handlers.Bitcoin' in sys.modules)\n"
+        )
+        self.assertEqual(out, ['True True'])
+
+    def test_preload_handlers(self):
+        coin = Coin(symbol='TESTCOIN')
+        ch.add_handler_coin('Bitcoin', coin)
+        ch.enable_handler('Bitcoin')
+        ch.reload_handlers()
+        ch.preload_handlers()
+        self.assertIn('TESTCOIN', ch.handlers)
+        self.assertEqual(type(ch.handlers['TESTCOIN']['managers'][0]).__name__, 'BitcoinManager')
+
+    def test_loader_per_symbol(self):
+        """Test each of a handler's symbols gets it's own loader, which only loads that symbol's deposits"""
+        ch.add_handler_coins('Bitcoin', Coin(symbol='TESTCOIN'), Coin(symbol='TESTCOIN2'))
+        ch.reload_handlers()
+        l1, l2 = ch.get_loader('TESTCOIN'), ch.get_loader('TESTCOIN2')
+        self.assertIsNot(l1, l2)
+        self.assertEqual(l1.symbols, ['TESTCOIN'])
+        self.assertEqual(l2.symbols, ['TESTCOIN2'])
+        # No loader instance should be returned for more than one symbol by get_loaders()
+        loaders = [l for _, ls in ch.get_loaders() for l in ls]
+        self.assertEqual(len(loaders), len(set(map(id, loaders))))
+
+    def test_add_coins(self):
+        self.assertFalse(ch.handler_has_coin('Bitcoin', 'TESTCOIN'))
+        added = ch.add_handler_coins('Bitcoin', Coin(symbol='TESTCOIN'), Coin(symbol='TESTCOIN2'), 'BTC', 'btc')
+        self.assertEqual(added, 3)
+        self.assertTrue(ch.handler_has_coin('Bitcoin', 'TESTCOIN'))
+        self.assertTrue(ch.handler_has_coin('Bitcoin', 'TESTCOIN2'))
+        self.assertTrue(ch.handler_has_coin('Bitcoin', 'BTC'))
+
+    def test_has_coin_replaced_inplace(self):
+        """Test handler_has_coin notices a coin being swapped out in-place, without the list's length changing"""
+        ch.add_handler_coin('Bitcoin', Coin(symbol='TESTCOIN'))
+        self.assertTrue(ch.handler_has_coin('Bitcoin', 'TESTCOIN'))
+        coins = ch.COIN_HANDLERS['Bitcoin']['coins']
+        coins[coins.index(ch.COIN_MAP['TESTCOIN'])] = Coin(symbol='TESTCOIN2')
+        self.assertFalse(ch.handler_has_coin('Bitcoin', 'TESTCOIN'))
+        self.assertTrue(ch.handler_has_coin('Bitcoin', 'TESTCOIN2'))
+
+
+class StubManager(BaseManager):
+    """Minimal issuing manager which records whether :py:meth:`.send` or :py:meth:`.issue` was called"""
+    can_issue = True
+
+    def __init__(self, bal=Decimal('10'), **kwargs):
+        super().__init__(settings={}, coin=Coin(symbol='STUB'), **kwargs)
+        self.bal = bal
+        self.calls = []
+
+    def address_valid(self, address) -> bool:
+        return True
+
+    def get_deposit(self) -> tuple:
+        return 'account', 'stub'
+
+    def balance(self, address: str = None, memo: str = None, memo_case: bool = False) -> Decimal:
+        if isinstance(self.bal, Exception):
+            raise self.bal
+        return self.bal
+
+    def issue(self, amount, address, memo=None, trigger_data=None) -> dict:
+        self.calls.append('issue')
+        return dict(send_type='issue')
+
+    def send(self, amount, address, from_address=None, memo=None, trigger_data=None) -> dict:
+        self.calls.append('send')
+        if Decimal(amount) > self.bal:
+            raise exceptions.NotEnoughBalance('stub balance too low')
+        return dict(send_type='send')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return self
+
+
+class TestSendOrIssue(unittest.TestCase):
+    def test_enough_balance(self):
+        mgr = StubManager()
+        self.assertEqual(mgr.send_or_issue('5', 'someone')['send_type'], 'send')
+        self.assertEqual(mgr.calls, ['send'])
+
+    def test_low_balance_issues(self):
+        """Test a known low balance skips the send attempt and goes straight to issuing"""
+        mgr = StubManager()
+        self.assertEqual(mgr.send_or_issue('50', 'someone')['send_type'], 'issue')
+        self.assertEqual(mgr.calls, ['issue'])
+
+    def test_balance_error_sends(self):
+        """Test a failing balance check falls through to sending, and still issues if the send is short"""
+        mgr = StubManager(bal=ConnectionError('daemon down'))
+        mgr.send = lambda **kw: mgr.calls.append('send') or dict(send_type='send')
+        self.assertEqual(mgr.send_or_issue('5', 'someone')['send_type'], 'send')
+        self.assertEqual(mgr.calls, ['send'])
+
+        mgr = StubManager(bal=ConnectionError('daemon down'))
+
+        def short_send(**kw):
+            mgr.calls.append('send')
+            raise exceptions.NotEnoughBalance('stub balance too low')
+
+        mgr.send = short_send
+        self.assertEqual(mgr.send_or_issue('5', 'someone')['send_type'], 'issue')
+        self.assertEqual(mgr.calls, ['send', 'issue'])
@@ -0,0 +1,181 @@
+import asyncio
+import itertools
+import unittest
+from time import sleep
+from types import SimpleNamespace
+from decimal import Decimal
+
+from privex.jsonrpc import MoneroRPC, RPCException
+
+from privex.coin_handlers.base.exceptions import AccountNotFound, NotEnoughBalance
+from privex.coin_handlers.base.objects import Coin
+from privex.coin_handlers.Monero.MoneroLoader import MoneroLoader
+from privex.coin_handlers.Monero.MoneroManager import MoneroManager
+
+
+class StubMoneroRPC(MoneroRPC):
+    """
+    A :class:`.MoneroRPC` which never touches the network - RPC calls are recorded in :py:attr:`.calls`, and answered
+    from a tiny in-memory wallet. Addresses starting with ``4`` or ``8`` are considered valid.
+    """
+    def __init__(self, unlocked: Decimal = Decimal('10'), transfers: dict = None):
+        super().__init__()
+        self.unlocked = unlocked
+        self.transfers = {} if transfers is None else transfers
+        """Incoming transfer dicts returned by ``get_transfers``, mapped by wallet filename"""
+        self.open = None
+        self.calls = []
+
+    def call(self, method, *params, **dicdata):
+        self.calls.append((method, dicdata))
+        if method == 'open_wallet':
+            self.open = dicdata['filename']
+            return {}
+        if method == 'get_transfers':
+            wallet = self.open
+            # Give another thread the chance to open a different wallet mid-call, if calls aren't serialised
+            sleep(0.02)
+            if self.open != wallet:
+                raise RPCException(f'Wallet changed from {wallet} to {self.open} during get_transfers')
+            return {'in': list(self.transfers.get(wallet, []))}
+        if method == 'validate_address':
+            return dict(valid=dicdata['address'][0] in '48')
+        if method == 'get_balance':
+            atomic = int(self.decimal_to_atomic(self.unlocked))
+            return dict(balance=atomic, unlocked_balance=atomic, per_subaddress=[])
+        if method == 'transfer':
+            amount = sum(int(d['amount']) for d in dicdata['destinations'])
+            if amount + 10 ** 8 > self.decimal_to_atomic(self.unlocked):
+                raise RPCException('Error: not enough money')
+            return dict(tx_hash='abcdef', amount=amount, fee=10 ** 8, tx_key='key')
+        return {}
+
+    def methods(self):
+        return [c[0] for c in self.calls]
+
+
+class TestMoneroSend(unittest.TestCase):
+    def _manager(self, unlocked: Decimal = Decimal('10')) -> MoneroManager:
+        mgr = MoneroManager(settings={}, coin=Coin(symbol='XMR'))
+        rpc = StubMoneroRPC(unlocked=unlocked)
+        mgr.rpc = mgr.rpcs['XMR'] = rpc
+        mgr._rpc_pools['XMR'] = itertools.cycle([rpc])
+        # Address validity is cached per (symbol, address) across all managers
+        MoneroManager._validate_address.cache_clear()
+        return mgr
+
+    def test_send_many(self):
+        """Test send_many sends to every destination using a single multi-destination transfer"""
+        mgr = self._manager()
+        res = mgr.send_many([dict(amount=Decimal('1.5'), address='4aaaa'), dict(amount='2', address='8bbbb')])
+        transfers = [c for c in mgr.rpc.calls if c[0] == 'transfer']
+        self.assertEqual(len(transfers), 1)
+        dests = transfers[0][1]['destinations']
+        self.assertEqual([d['address'] for d in dests], ['4aaaa', '8bbbb'])
+        self.assertEqual([int(d['amount']) for d in dests], [1500000000000, 2000000000000])
+        self.assertEqual(res['amount'], Decimal('3.5'))
+        self.assertEqual(res['fee'], Decimal('0.0001'))
+        self.assertEqual(res['txid'], 'abcdef')
+        self.assertEqual(res['coin'], 'XMR')
+
+    def test_send(self):
+        """Test send is a single destination send_many"""
+        mgr = self._manager()
+        res = mgr.send(amount=Decimal('1'), address='4aaaa')
+        self.assertEqual(res['amount'], Decimal('1'))
+        self.assertIn('transfer', mgr.rpc.methods())
+
+    def test_send_many_invalid_address(self):
+        """Test an invalid destination address aborts before anything is transferred"""
+        mgr = self._manager()
+        with self.assertRaises(AccountNotFound):
+            mgr.send_many([dict(amount='1', address='4aaaa'), dict(amount='1', address='NotAnAddress')])
+        self.assertNotIn('transfer', mgr.rpc.methods())
+
+    def test_send_many_low_balance(self):
+        """Test a 'not enough money' error from the wallet's transfer call is raised as NotEnoughBalance"""
+        mgr = self._manager(unlocked=Decimal('3'))
+        with self.assertRaises(NotEnoughBalance):
+            mgr.send_many([dict(amount='2', address='4aaaa'), dict(amount='1', address='8bbbb')])
+        # No separate balance lookup is made before the transfer
+        self.assertEqual([m for m in mgr.rpc.methods() if m != 'validate_address'], ['transfer'])
+
+    def test_balance_async(self):
+        """Test balance_async runs balance() in an executor of the running event loop"""
+        mgr = self._manager(unlocked=Decimal('2.5'))
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(mgr.balance_async()), Decimal('2.5'))
+        finally:
+            loop.close()
+
+
+def _transfer(txid: str, confirmations=10, amount='1.5', **kwargs) -> SimpleNamespace:
+    """Build a stand-in for an incoming :class:`privex.jsonrpc.objects.MoneroTransfer`"""
+    return SimpleNamespace(**{
+        'txid': txid, 'type': 'in', 'address': '4aaaa', 'decimal_amount': Decimal(amount), 'timestamp': 1559392200,
+        'confirmations': confirmations, 'suggested_confirmations_threshold': 1, **kwargs
+    })
+
+
+def _raw_transfer(txid: str, amount: int, address='4aaaa') -> dict:
+    """Build an incoming transfer dict, as returned by the ``get_transfers`` wallet RPC call"""
+    return dict(txid=txid, type='in', address=address, amount=amount, confirmations=10, timestamp=1559392200)
+
+
+class TestMoneroLoader(unittest.TestCase):
+    def _loader(self) -> MoneroLoader:
+        """A loader with two symbols, each using a different wallet on the same (stubbed) wallet RPC endpoint"""
+        loader = MoneroLoader(settings={}, coins=[
+            Coin(symbol='XMR', setting_json='{"wallet": "wallet1", "account_id": 0, "min_height": 100}'),
+            Coin(symbol='XMRTWO', setting_json='{"wallet": "wallet2", "account_id": 3}'),
+        ])
+        rpc = StubMoneroRPC(transfers=dict(
+            wallet1=[_raw_transfer('tx1', 1500000000000), _raw_transfer('tx2', 2000000000000)],
+            wallet2=[_raw_transfer('tx3', 250000000000)],
+        ))
+        loader.rpcs = dict(XMR=rpc, XMRTWO=rpc)
+        return loader
+
+    def test_fetch_transfers(self):
+        """Test each symbol's transfers are loaded from it's own wallet / account, using min_height if it's set"""
+        loader = self._loader()
+        rpc = loader.rpcs['XMR']
+        sym, txs = loader._fetch_transfers('XMR')
+        self.assertEqual((sym, [t.txid for t in txs]), ('XMR', ['tx1', 'tx2']))
+        sym, txs = loader._fetch_transfers('XMRTWO')
+        self.assertEqual((sym, [t.txid for t in txs]), ('XMRTWO', ['tx3']))
+
+        gets = [c[1] for c in rpc.calls if c[0] == 'get_transfers']
+        self.assertEqual((gets[0]['account_index'], gets[0]['min_height'], gets[0]['filter_by_height']), (0, 100, True))
+        self.assertEqual(gets[1]['account_index'], 3)
+        self.assertNotIn('min_height', gets[1])
+        self.assertFalse(gets[0]['out'])
+
+    def test_list_txs_shared_endpoint(self):
+        """Test symbols sharing a wallet RPC have their wallets opened / read one at a time, despite being concurrent"""
+        loader = self._loader()
+        rpc = loader.rpcs['XMR']
+        deps = sorted(loader.list_txs(), key=lambda d: d.txid)
+        self.assertEqual([(d.txid, d.coin, d.amount) for d in deps], [
+            ('tx1', 'XMR', Decimal('1.5')), ('tx2', 'XMR', Decimal('2')), ('tx3', 'XMRTWO', Decimal('0.25')),
+        ])
+        # Each wallet must be opened, read and stored before the other wallet is opened
+        methods = [m for m in rpc.methods() if m in ('open_wallet', 'get_transfers', 'store')]
+        self.assertEqual(methods, ['open_wallet', 'get_transfers', 'store'] * 2)
+        self.assertEqual(len(loader._wallet_locks), 1)
+
+    def test_process_transfers(self):
+        """Test unconfirmed and malformed transfers are skipped, without stopping the valid ones being loaded"""
+        loader = MoneroLoader(settings={}, coins=[Coin(symbol='XMR', setting_json='{"confirms_needed": 5}')])
+        txs = [
+            _transfer('good1'),
+            _transfer('unconfirmed', confirmations=0, suggested_confirmations_threshold=3),
+            _transfer('bad_confs', confirmations=None),
+            _transfer('bad_threshold', confirmations=0, suggested_confirmations_threshold='x'),
+            _transfer('good2', amount='2'),
+        ]
+        deps = list(loader._process_transfers('XMR', txs))
+        self.assertEqual([d.txid for d in deps], ['good1', 'good2'])
+        self.assertEqual(deps[1].amount, Decimal('2'))
+        self.assertEqual(deps[0].coin, 'XMR')
@@ -0,0 +1,62 @@
+import copy
+import pickle
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+
+from privex.coin_handlers.base import objects
+from privex.coin_handlers.base.objects import Coin, Deposit, convert_datetime
+
+
+def _roundtrips(obj):
+    """Returns a copy of ``obj`` made by each of ``copy.copy``, ``copy.deepcopy`` and a pickle round trip"""
+    return copy.copy(obj), copy.deepcopy(obj), pickle.loads(pickle.dumps(obj))
+
+
+class TestObjects(unittest.TestCase):
+    def test_coin_copy_pickle(self):
+        """Test Coin objects (including one with cached JSON settings) can be copied and pickled"""
+        coin = Coin(symbol='BTC', setting_host='127.0.0.1', setting_json='{"confirms_needed": 2}')
+        self.assertEqual(coin.settings['json'], {'confirms_needed': 2})
+        for c in _roundtrips(coin):
+            self.assertEqual(c, coin)
+            self.assertEqual(c.symbol, 'BTC')
+            self.assertEqual(c.settings['json'], {'confirms_needed': 2})
+
+    def test_deposit_copy_pickle(self):
+        """Test Deposit objects can be copied and pickled"""
+        dep = Deposit(coin='BTC', tx_timestamp='2019-06-01T12:30:00Z', amount='1.5', txid='abcd', address='1abc')
+        for d in _roundtrips(dep):
+            self.assertEqual(d, dep)
+            self.assertEqual(d.amount, Decimal('1.5'))
+            self.assertEqual(dict(d), dict(dep))
+
+    def test_deposit_slots(self):
+        """Test Deposit objects store their fields in slots, without a per-instance __dict__"""
+        dep = Deposit(coin='BTC', tx_timestamp='2019-06-01T12:30:00Z', amount='1.5')
+        self.assertFalse(hasattr(dep, '__dict__'))
+        with self.assertRaises(AttributeError):
+            dep.not_a_field = 1
+        # Coin keeps it's __dict__, as it's used to cache the decoded setting_json
+        self.assertTrue(hasattr(Coin(symbol='BTC'), '__dict__'))
+
+    def _check_convert_datetime(self):
+        expected = datetime(2019, 6, 1, 12, 30, tzinfo=timezone.utc)
+        self.assertEqual(convert_datetime('2019-06-01T12:30:00+00:00'), expected)
+        self.assertEqual(convert_datetime('2019-06-01T12:30:00Z'), expected)
+        self.assertEqual(convert_datetime(int(expected.timestamp())), expected)
+        self.assertIs(convert_datetime(expected), expected)
+        # Naive timestamps stay naive
+        self.assertEqual(convert_datetime('2019-06-01 12:30:00'), datetime(2019, 6, 1, 12, 30))
+        with self.assertRaises(ValueError):
+            convert_datetime(1.5)
+
+    def test_convert_datetime(self):
+        """Test convert_datetime with str, 'Z' suffixed str, datetime and int timestamps"""
+        self._check_convert_datetime()
+
+    def test_convert_datetime_no_isoformat(self):
+        """Test convert_datetime falls back to dateutil when datetime.fromisoformat isn't available (Python 3.6)"""
+        with mock.patch.object(objects, '_HAS_ISOFORMAT', False):
+            self._check_convert_datetime()